@@ -15,20 +15,22 @@ print(result.output)
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
 from datetime import timedelta
 
 from temporalio import activity, workflow
 from temporalio.client import Client
+from temporalio.contrib.pydantic import pydantic_data_converter
 from temporalio.worker import Worker
 
 with workflow.unsafe.imports_passed_through():
+    import httpx
+    from pydantic import BaseModel
     from pydantic_ai import Agent
+    from pydantic_ai.models.openai import OpenAIModel
+    from pydantic_ai.providers.openai import OpenAIProvider
 
 
-@dataclass
-class RunAgentInput:
+class RunAgentInput(BaseModel):
     """
     Run agent input.
     """
@@ -36,8 +38,7 @@ class RunAgentInput:
     question: str
 
 
-@dataclass
-class HelloWorkflowInput:
+class HelloWorkflowInput(BaseModel):
     """
     Hello workflow input.
     """
@@ -51,18 +52,27 @@ class AgentActivities:
     """
 
     def __init__(self):
+        # Share one pooled HTTP client across activity invocations so that
+        # OpenAI requests reuse keep-alive connections instead of re-handshaking.
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=httpx.Timeout(30.0),
+        )
         self._agent = Agent(
-            "openai:gpt-4o",
+            OpenAIModel(
+                "gpt-4o",
+                provider=OpenAIProvider(http_client=self._http_client),
+            ),
             system_prompt="Be concise, reply with one sentence.",
         )
 
     @activity.defn
-    def run_agent(self, arg: RunAgentInput) -> str:
+    async def run_agent(self, arg: RunAgentInput) -> str:
         """
         Ask the agent a question.
         """
         activity.logger.info("Running agent with question %s" % arg.question)
-        result = self._agent.run_sync(arg.question)
+        result = await self._agent.run(arg.question)
         return result.output
 
 
@@ -78,7 +88,7 @@ class PydanticAiHelloWorkflow:
 
         return await workflow.execute_activity(
             AgentActivities.run_agent,
-            RunAgentInput(arg.question),
+            RunAgentInput(question=arg.question),
             start_to_close_timeout=timedelta(seconds=10),
         )
 
@@ -92,7 +102,9 @@ async def main():
     logging.basicConfig(level=logging.INFO)
 
     # Start client
-    client = await Client.connect("localhost:7233")
+    client = await Client.connect(
+        "localhost:7233", data_converter=pydantic_data_converter
+    )
 
     TASK_QUEUE = "pydantic-ai-hello-world-task-queue"
     # Run a worker for the workflow
@@ -101,7 +113,8 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[PydanticAiHelloWorkflow],
         activities=[AgentActivities().run_agent],
-        activity_executor=ThreadPoolExecutor(5),
+        max_concurrent_activities=100,
+        max_concurrent_workflow_tasks=100,
     ):
         result = await client.execute_workflow(
             PydanticAiHelloWorkflow.run,
@@ -5,8 +5,8 @@ Shows tools and dependency injection from Pydantic AI.
 """
 
 import asyncio
+import functools
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 
@@ -50,7 +50,7 @@ class DatabaseConn:
         raise ValueError("Customer not found")
 
 
-@dataclass
+@dataclass(slots=True)
 class SupportDependencies:
     """
     Support agent dependencies.
@@ -70,7 +70,7 @@ class SupportOutput(BaseModel):
     risk: int = Field(description="Risk level of query", ge=0, le=10)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSupportAgentInput:
     """
     Run support agent input.
@@ -80,56 +80,72 @@ class RunSupportAgentInput:
     customer_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RunQueryInput(RunSupportAgentInput):
     """
     Run support agent query input.
     """
 
 
+_DB = DatabaseConn()
+
+
+@functools.cache
+def _build_support_agent() -> Agent[SupportDependencies, SupportOutput]:
+    """
+    Build the support agent once per worker process.
+
+    Built lazily rather than at import so that the workflow sandbox, which
+    re-imports this module, never constructs the model client.
+    """
+    support_agent = Agent(
+        "openai:gpt-4o",
+        deps_type=SupportDependencies,
+        output_type=SupportOutput,
+        system_prompt=(
+            "You are a support agent in our bank, give the "
+            "customer support and judge the risk level of their query. "
+            "Always greet and address the customer by name in your response."
+        ),
+    )
+
+    @support_agent.system_prompt
+    async def add_customer_name(ctx: RunContext[SupportDependencies]) -> str:
+        customer_name = await ctx.deps.db.customer_name(
+            account_id=ctx.deps.customer_id
+        )
+        return f"The customer's name is {customer_name}!"
+
+    @support_agent.tool
+    async def customer_balance(
+        ctx: RunContext[SupportDependencies], include_pending: bool
+    ) -> str:
+        """Returns the customer's current account balance."""
+        balance = await ctx.deps.db.customer_balance(
+            account_id=ctx.deps.customer_id,
+            include_pending=include_pending,
+        )
+        return f"${balance:.2f}"
+
+    return support_agent
+
+
 class SupportAgentActivities:
     """
     Support agent activities.
     """
 
     def __init__(self):
-        self._support_agent = Agent(
-            "openai:gpt-4o",
-            deps_type=SupportDependencies,
-            output_type=SupportOutput,
-            system_prompt=(
-                "You are a support agent in our bank, give the "
-                "customer support and judge the risk level of their query. "
-                "Always greet and address the customer by name in your response."
-            ),
-        )
-
-        @self._support_agent.system_prompt
-        async def add_customer_name(ctx: RunContext[SupportDependencies]) -> str:
-            customer_name = await ctx.deps.db.customer_name(
-                account_id=ctx.deps.customer_id
-            )
-            return f"The customer's name is {customer_name}!"
-
-        @self._support_agent.tool
-        async def customer_balance(
-            ctx: RunContext[SupportDependencies], include_pending: bool
-        ) -> str:
-            """Returns the customer's current account balance."""
-            balance = await ctx.deps.db.customer_balance(
-                account_id=ctx.deps.customer_id,
-                include_pending=include_pending,
-            )
-            return f"${balance:.2f}"
+        self._support_agent = _build_support_agent()
 
     @activity.defn
-    def run_query(self, arg: RunQueryInput) -> SupportOutput:
+    async def run_query(self, arg: RunQueryInput) -> SupportOutput:
         """
         Ask the agent a question.
         """
         activity.logger.info("Running agent with question %s" % arg.query)
-        deps = SupportDependencies(customer_id=arg.customer_id, db=DatabaseConn())
-        result = self._support_agent.run_sync(arg.query, deps=deps)
+        deps = SupportDependencies(customer_id=arg.customer_id, db=_DB)
+        result = await self._support_agent.run(arg.query, deps=deps)
         return result.output
 
 
@@ -143,18 +159,20 @@ class SupportAgentWorkflow:
     async def run(self) -> SupportOutput:
         workflow.logger.info("Running support agent workflow")
 
-        balance_result: SupportOutput = await workflow.execute_activity(
-            SupportAgentActivities.run_query,
-            RunQueryInput(query="What is my balance?", customer_id=123),
-            start_to_close_timeout=timedelta(seconds=10),
+        # The two customers' queries are independent, so run them concurrently
+        balance_result, lost_card_result = await asyncio.gather(
+            workflow.execute_activity(
+                SupportAgentActivities.run_query,
+                RunQueryInput(query="What is my balance?", customer_id=123),
+                start_to_close_timeout=timedelta(seconds=10),
+            ),
+            workflow.execute_activity(
+                SupportAgentActivities.run_query,
+                RunQueryInput(query="I just lost my card!", customer_id=456),
+                start_to_close_timeout=timedelta(seconds=10),
+            ),
         )
         workflow.logger.info("Support agent workflow result: %s", balance_result)
-
-        lost_card_result: SupportOutput = await workflow.execute_activity(
-            SupportAgentActivities.run_query,
-            RunQueryInput(query="I just lost my card!", customer_id=456),
-            start_to_close_timeout=timedelta(seconds=10),
-        )
         workflow.logger.info("Support agent workflow result: %s", lost_card_result)
 
 
@@ -177,7 +195,6 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[SupportAgentWorkflow],
         activities=[SupportAgentActivities().run_query],
-        activity_executor=ThreadPoolExecutor(5),
     ):
         await client.execute_workflow(
             SupportAgentWorkflow.run,
@@ -2,31 +2,27 @@ import asyncio
 import os
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Dict, List
 
 from temporalio import activity, workflow
 from temporalio.client import Client
+from temporalio.contrib.pydantic import pydantic_data_converter
 from temporalio.worker import Worker
 
 with workflow.unsafe.imports_passed_through():
+    import httpx
     import litellm
     from pydantic import BaseModel, ValidationError
+    from selenium.common.exceptions import WebDriverException
 
     from agents.smolagents.web import WeatherAgent
 
 
-@dataclass
-class ChatMessage:
-    role: str
-    content: str
-
-
-@dataclass
-class ChatRequest:
+class ChatRequest(BaseModel):
     new_user_message: str
-    conversation_history: List[ChatMessage]
+    # Messages already in the `{"role": ..., "content": ...}` shape litellm expects
+    conversation_history: List[Dict[str, str]]
 
 
 class ToolArgument(BaseModel):
@@ -54,39 +50,59 @@ TOOLS = [
     ),
 ]
 
+# Describe the available tools once, since TOOLS does not change at runtime
+_TOOLS_DESCRIPTION = "Available tools:\n" + "".join(
+    f"- {tool.name}: {tool.description} Arguments: "
+    + ", ".join(f"{arg.name} ({arg.type})" for arg in tool.arguments)
+    + "\n"
+    for tool in TOOLS
+)
 
-@activity.defn
-async def get_tool_activity(user_message: str) -> Tool:
-    """
-    Activity to get the tools available and determine which tool to use.
-    """
-    # Create a system prompt that describes the available tools
-    tools_description = "Available tools:\n"
-    for tool in TOOLS:
-        args_desc = ", ".join([f"{arg.name} ({arg.type})" for arg in tool.arguments])
-        tools_description += (
-            f"- {tool.name}: {tool.description} Arguments: {args_desc}\n"
-        )
+_TOOL_SELECTION_PROMPT = f"""You are a tool selection assistant. Given a user request, determine which tool should be used and extract the required arguments.
 
-    # Create messages for the LLM to analyze the user request
-    messages = [
-        {
-            "role": "system",
-            "content": f"""You are a tool selection assistant. Given a user request, determine which tool should be used and extract the required arguments.
-
-{tools_description}
+{_TOOLS_DESCRIPTION}
 
 Respond with ONLY the tool name and arguments in this exact format:
 TOOL: tool_name
 ARGS: arg1_value, arg2_value, ...
 
 If no specific tool is needed or the request is just general chat, use the 'chat' tool.
-If the user is asking about weather, use the 'get_current_weather' tool and extract the location.""",
-        }
-    ]
+If the user is asking about weather, use the 'get_current_weather' tool and extract the location."""
+
+# LiteLLM model used for chat, overridable with the `CHAT_MODEL` environment variable.
+# `anthropic/...` models also get an explicit prompt cache breakpoint.
+CHAT_MODEL = os.getenv("CHAT_MODEL", "openai/gpt-4o")
+
+# Once the history grows past this many messages, the oldest ones are summarized
+# so that payload size and prompt prefill stay bounded on long conversations
+HISTORY_MAX_MESSAGES = 20
+# Number of most recent messages kept verbatim when the history is summarized
+HISTORY_KEEP_RECENT = 10
+
+# The browser-backed weather activity runs on a dedicated worker and task queue
+BROWSER_TASK_QUEUE = "weather-bot-browser-task-queue"
+
+# The system message is always sent first and never changes during a conversation,
+# so the provider can reuse its cached prompt prefix across turns.
+_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a helpful AI assistant. Be friendly and helpful in your responses. "
+        "You cannot answer questions that requires real-time data like the current weather."
+    ),
+}
 
-    # Add the new user message
-    messages.append({"role": "user", "content": user_message})
+
+@activity.defn
+async def get_tool_activity(user_message: str) -> Tool:
+    """
+    Activity to get the tools available and determine which tool to use.
+    """
+    # Create messages for the LLM to analyze the user request
+    messages = [
+        {"role": "system", "content": _TOOL_SELECTION_PROMPT},
+        {"role": "user", "content": user_message},
+    ]
 
     # Call the LLM to determine the tool and arguments
     response = await litellm.acompletion(
@@ -112,55 +128,134 @@ async def call_llm_activity(request: ChatRequest) -> str:
     """
     Activity to call the LLM using litellm with conversation history.
     """
-    # Convert conversation history to the format expected by litellm
-    messages = []
-    for msg in request.conversation_history:
-        messages.append({"role": msg.role, "content": msg.content})
+    # Keep the immutable system message as the stable prefix
+    messages = [_CHAT_SYSTEM_MESSAGE, *request.conversation_history]
+
+    # Anthropic only caches prompt prefixes up to an explicit breakpoint,
+    # so mark the last stable turn before the new user message
+    if CHAT_MODEL.startswith("anthropic/"):
+        last = messages[-1]
+        messages[-1] = {
+            "role": last["role"],
+            "content": [
+                {
+                    "type": "text",
+                    "text": last["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
 
     # Add the new user message
     messages.append({"role": "user", "content": request.new_user_message})
 
-    # Call the LLM using litellm
-    response = await litellm.acompletion(
-        model="openai/gpt-4o", messages=messages, temperature=0.7, max_tokens=1000
+    # Call the LLM using litellm, streaming tokens as they are generated
+    stream = await litellm.acompletion(
+        model=CHAT_MODEL,
+        messages=messages,
+        temperature=0.7,
+        max_tokens=1000,
+        stream=True,
     )
 
-    # Extract the response content
-    assistant_response = response.choices[0].message.content
+    # Collect the response content, heartbeating so the activity can be cancelled mid-stream
+    chunks: List[str] = []
+    async for chunk in stream:
+        chunks.append(chunk.choices[0].delta.content or "")
+        activity.heartbeat(len(chunks))
+    assistant_response = "".join(chunks)
 
     return assistant_response
 
 
+@activity.defn
+async def summarize_history_activity(messages: List[Dict[str, str]]) -> str:
+    """
+    Activity to summarize older conversation turns into a short recap.
+    """
+    transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in messages)
+    response = await litellm.acompletion(
+        model=CHAT_MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "Summarize the following conversation in a few sentences, "
+                "keeping any facts the user may refer back to.",
+            },
+            {"role": "user", "content": transcript},
+        ],
+        temperature=0.1,
+        max_tokens=300,
+    )
+    return response.choices[0].message.content
+
+
 @activity.defn
 async def get_user_input() -> str:
     """
     Activity to get user input from terminal.
 
+    `input` blocks, so it is read in a thread to avoid stalling the event loop
+    serving the async LLM activities.
+
     Please don't use `input` in an activity in production!
     """
-    return input("👤 You: ").strip()
+    user_input = await asyncio.to_thread(input, "👤 You: ")
+    return user_input.strip()
 
 
-@activity.defn
-async def get_current_weather(location: str) -> str:
+class WeatherActivities:
     """
-    Activity to get the current weather.
+    Weather activities.
     """
-    return WeatherAgent().run(location=location)
+
+    def __init__(self):
+        # Starting Chrome takes seconds, so keep one browser agent for the worker's lifetime
+        self._weather_agent = WeatherAgent()
+
+    @activity.defn
+    def get_current_weather(self, location: str) -> str:
+        """
+        Activity to get the current weather.
+
+        Selenium is blocking, so this runs on its own worker and thread rather than
+        on the event loop that serves the LLM activities.
+        """
+        try:
+            return self._weather_agent.run(location=location)
+        finally:
+            self._reset_browser()
+
+    def _reset_browser(self) -> None:
+        """
+        Reset the browser so the next run starts from a blank page.
+
+        If the browser crashed or its session died, it is restarted instead, so that
+        retries and later activities do not keep failing until the worker restarts.
+        Errors are logged rather than raised to not hide the activity's own error.
+        """
+        try:
+            self._weather_agent.driver.get("about:blank")
+            return
+        except WebDriverException:
+            activity.logger.warning("Browser is unusable, restarting it", exc_info=True)
+
+        try:
+            self._weather_agent.driver.quit()
+        except WebDriverException:
+            pass
+        try:
+            self._weather_agent = WeatherAgent()
+        except WebDriverException:
+            activity.logger.exception("Failed to restart the browser")
 
 
 @workflow.defn
 class WeatherBotWorkflow:
     def __init__(self):
-        self.conversation_history: List[ChatMessage] = [
-            ChatMessage(
-                role="system",
-                content="""
-                You are a helpful AI assistant. Be friendly and helpful in your responses.
-                You cannot answer questions that requires real-time data like the current weather.
-                """,
-            )
-        ]
+        # Only user and assistant turns, stored in the wire format sent to the LLM so
+        # they are not re-converted on every turn; the activity prepends the system message
+        self.conversation_history: List[Dict[str, str]] = []
         self.should_exit = False
 
     @workflow.run
@@ -189,8 +284,9 @@ class WeatherBotWorkflow:
 
                 if tool.name == "get_current_weather":
                     tool_response = await workflow.execute_activity(
-                        get_current_weather,
+                        WeatherActivities.get_current_weather,
                         tool.arguments[0].value,
+                        task_queue=BROWSER_TASK_QUEUE,
                         start_to_close_timeout=timedelta(seconds=30),
                     )
                 else:  # Default to chat tool
@@ -206,12 +302,33 @@ class WeatherBotWorkflow:
                 workflow.logger.info("🤖 Weather Bot response: %s", tool_response)
 
                 # Update conversation history
-                self.conversation_history.append(
-                    ChatMessage(role="user", content=user_message)
-                )
-                self.conversation_history.append(
-                    ChatMessage(role="assistant", content=tool_response)
+                self.conversation_history.extend(
+                    [
+                        {"role": "user", "content": user_message},
+                        {"role": "assistant", "content": tool_response},
+                    ]
                 )
+                if len(self.conversation_history) > HISTORY_MAX_MESSAGES:
+                    await self._summarize_history()
+
+    async def _summarize_history(self) -> None:
+        """
+        Replace the oldest turns with a summary, keeping the most recent turns verbatim.
+        """
+        older = self.conversation_history[:-HISTORY_KEEP_RECENT]
+        recent = self.conversation_history[-HISTORY_KEEP_RECENT:]
+        summary = await workflow.execute_activity(
+            summarize_history_activity,
+            older,
+            start_to_close_timeout=timedelta(seconds=10),
+        )
+        self.conversation_history = [
+            {
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {summary}",
+            },
+            *recent,
+        ]
 
 
 async def main():
@@ -222,12 +339,20 @@ async def main():
 
     logging.basicConfig(level=logging.INFO)
 
+    # Share one pooled HTTP client across all litellm async calls
+    litellm.aclient_session = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
     # Start client
-    client = await Client.connect("localhost:7233")
+    client = await Client.connect(
+        "localhost:7233", data_converter=pydantic_data_converter
+    )
 
     TASK_QUEUE = "weather-bot-task-queue"
 
-    # Run a worker for the workflow
+    # Run a worker for the workflow and LLM activities, and a separate worker that
+    # owns the single Chrome instance so browser work never blocks LLM dispatch
     async with Worker(
         client,
         task_queue=TASK_QUEUE,
@@ -236,9 +361,15 @@ async def main():
             call_llm_activity,
             get_user_input,
             get_tool_activity,
-            get_current_weather,
+            summarize_history_activity,
         ],
-        activity_executor=ThreadPoolExecutor(5),
+        max_concurrent_activities=100,
+        max_concurrent_workflow_tasks=100,
+    ), Worker(
+        client,
+        task_queue=BROWSER_TASK_QUEUE,
+        activities=[WeatherActivities().get_current_weather],
+        activity_executor=ThreadPoolExecutor(1),
     ):
         await client.execute_workflow(
             WeatherBotWorkflow.run,
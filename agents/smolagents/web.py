@@ -4,7 +4,6 @@ from time import sleep
 import helium
 from PIL import Image
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from smolagents import CodeAgent, LiteLLMModel, tool
 from smolagents.agents import ActionStep
@@ -16,6 +15,22 @@ chrome_options.add_argument("--window-size=1000,1350")
 chrome_options.add_argument("--disable-pdf-viewer")
 chrome_options.add_argument("--window-position=0,0")
 
+# Walk the DOM text nodes natively, passing the search text as a script argument
+# rather than interpolating it into an XPath (which breaks on quotes).
+_FIND_TEXT_ELEMENTS_SCRIPT = """
+const text = arguments[0];
+const elements = [];
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+let node;
+while ((node = walker.nextNode())) {
+    const parent = node.parentElement;
+    if (node.nodeValue.includes(text) && elements[elements.length - 1] !== parent) {
+        elements.push(parent);
+    }
+}
+return elements;
+"""
+
 
 @tool
 def search_item_ctrl_f(text: str, nth_result: int = 1) -> str:
@@ -26,7 +41,7 @@ def search_item_ctrl_f(text: str, nth_result: int = 1) -> str:
         nth_result: Which occurrence to jump to (default: 1)
     """
     driver = helium.get_driver()
-    elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{text}')]")
+    elements = driver.execute_script(_FIND_TEXT_ELEMENTS_SCRIPT, text)
     if nth_result > len(elements):
         raise ValueError(
             f"Match nth {nth_result} not found (only {len(elements)} matches found)"
@@ -64,20 +79,20 @@ def save_screenshot(memory_step: ActionStep, agent: CodeAgent) -> None:
     driver = helium.get_driver()
     current_step = memory_step.step_number
     if driver is not None:
-        for (
-            previous_memory_step
-        ) in agent.memory.steps:  # Remove previous screenshots for lean processing
+        # Remove previous screenshots for lean processing. Older steps were already
+        # cleared by earlier callbacks, so only the most recent eligible step needs it.
+        for previous_memory_step in reversed(agent.memory.steps):
             if (
                 isinstance(previous_memory_step, ActionStep)
                 and previous_memory_step.step_number <= current_step - 2
             ):
                 previous_memory_step.observations_images = None
+                break
         png_bytes = driver.get_screenshot_as_png()
         image = Image.open(BytesIO(png_bytes))
+        image.load()  # Decode now so the image persists without an extra copy
         print(f"Captured a browser screenshot: {image.size} pixels")
-        memory_step.observations_images = [
-            image.copy()
-        ]  # Create a copy to ensure it persists
+        memory_step.observations_images = [image]
 
     # Update observations with current URL
     url_info = f"Current url: {driver.current_url}"
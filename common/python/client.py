@@ -2,6 +2,7 @@
 Temporal Cloud client.
 """
 
+import asyncio
 import os
 from pathlib import Path
 
@@ -16,6 +17,9 @@ class TemporalCloudClient:
     Temporal Cloud client.
     """
 
+    # Certificate and key bytes by path; these don't change during a process lifetime
+    _cert_cache: dict[Path, bytes] = {}
+
     def __init__(
         self,
         namespace: str,
@@ -32,10 +36,8 @@ class TemporalCloudClient:
         """
         Create a Temporal client to Temporal Cloud.
         """
-        with open(self.cert_path, "rb") as cert_file:
-            client_cert = cert_file.read()
-        with open(self.key_path, "rb") as key_file:
-            client_private_key = key_file.read()
+        client_cert = await self._read_cached(self.cert_path)
+        client_private_key = await self._read_cached(self.key_path)
         client = await Client.connect(
             self.endpoint,
             namespace=self.namespace_id,
@@ -47,6 +49,17 @@ class TemporalCloudClient:
         )
         return client
 
+    @classmethod
+    async def _read_cached(cls, path: Path) -> bytes:
+        """
+        Read a file off the event loop, caching its contents for later connects.
+        """
+        content = cls._cert_cache.get(path)
+        if content is None:
+            content = await asyncio.to_thread(path.read_bytes)
+            cls._cert_cache[path] = content
+        return content
+
 
 class TemporalDevClient:
     """
@@ -74,8 +87,22 @@ class TemporalClientFactory:
     Temporal client factory.
     """
 
+    # Connected client shared by every caller in this process
+    _client: Client | None = None
+    _lock = asyncio.Lock()
+
+    @classmethod
+    async def create_client(cls) -> Client:
+        """
+        Return the process-wide Temporal client, connecting on first use.
+        """
+        async with cls._lock:
+            if cls._client is None:
+                cls._client = await cls._connect()
+        return cls._client
+
     @staticmethod
-    async def create_client() -> Client:
+    async def _connect() -> Client:
         """
         Create a Temporal client based on the environment.
         """
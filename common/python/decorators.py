@@ -2,6 +2,8 @@
 Custom decorators for demo purposes.
 """
 
+from functools import wraps
+from itertools import count
 from typing import Callable
 
 
@@ -18,11 +20,13 @@ def simulate_failure(failure_count: int = 3) -> Callable:
     """
 
     def decorator(func):
-        call_count = 0
+        # `next` on an `itertools.count` is atomic, so concurrent calls from
+        # activity executor threads each observe a distinct call number
+        call_counter = count(1)
 
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
+            call_count = next(call_counter)
 
             if call_count <= failure_count:
                 raise RuntimeError(
@@ -31,10 +35,6 @@ def simulate_failure(failure_count: int = 3) -> Callable:
 
             return func(*args, **kwargs)
 
-        # Preserve function metadata
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
-
         return wrapper
 
     return decorator
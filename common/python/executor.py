@@ -0,0 +1,29 @@
+"""
+Activity executor for workers with sync activities.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def activity_thread_pool_size() -> int:
+    """
+    Number of threads for sync activities.
+
+    Read from the `WORKER_THREAD_POOL_SIZE` environment variable, falling back to the
+    same size as a `ThreadPoolExecutor` created without `max_workers`.
+    """
+    size = os.environ.get("WORKER_THREAD_POOL_SIZE")
+    if size:
+        return int(size)
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def create_activity_executor() -> ThreadPoolExecutor:
+    """
+    Create the thread pool for sync activities, sized with `activity_thread_pool_size`.
+
+    It is only meant for the worker's `activity_executor`, so that `asyncio.to_thread`
+    calls keep the loop's default executor rather than waiting behind busy activities.
+    """
+    return ThreadPoolExecutor(max_workers=activity_thread_pool_size())
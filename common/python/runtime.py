@@ -0,0 +1,25 @@
+"""
+Temporal runtime with Prometheus metrics.
+"""
+
+import functools
+
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
+
+PROMETHEUS_BIND_ADDRESS = "0.0.0.0:9000"
+
+
+@functools.cache
+def get_observable_runtime() -> Runtime:
+    """
+    Return the process-wide runtime that serves Prometheus metrics.
+
+    Only one runtime can bind the metrics endpoint, so every client in the process
+    must share it. Create it before connecting so that the default runtime is not
+    lazily created instead.
+    """
+    return Runtime(
+        telemetry=TelemetryConfig(
+            metrics=PrometheusConfig(bind_address=PROMETHEUS_BIND_ADDRESS)
+        )
+    )
@@ -1,15 +1,17 @@
+import asyncio
 import random
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-import pytz
 from temporalio import activity
 
 from order_notification.schemas.notification import NotificationChannelType
-from order_notification.schemas.order import OrderDetails
+from order_notification.schemas.order import OrderBundle, OrderDetails
 from order_notification.schemas.user import UserPreference
 from order_notification.schemas.vendor import VendorPreference
 
+_NOTIFICATION_CHANNELS = tuple(NotificationChannelType)
+
 
 @activity.defn
 async def get_order_details(order_id: str) -> OrderDetails:
@@ -23,7 +25,7 @@ async def get_order_details(order_id: str) -> OrderDetails:
         order_id=order_id,
         user_id=str(uuid.uuid4()),
         vendor_id=str(uuid.uuid4()),
-        order_date=datetime.now(tz=pytz.UTC),
+        order_date=datetime.now(timezone.utc),
     )
     return order_details
 
@@ -38,7 +40,7 @@ async def get_user_preference(user_id: str) -> UserPreference:
     )
     return UserPreference(
         user_id=user_id,
-        notification_preference=random.choice(list(NotificationChannelType)),
+        notification_preference=random.choice(_NOTIFICATION_CHANNELS),
     )
 
 
@@ -52,5 +54,26 @@ async def get_vendor_preference(vendor_id: str) -> VendorPreference:
     )
     return VendorPreference(
         vendor_id=vendor_id,
-        notification_preference=random.choice(list(NotificationChannelType)),
+        notification_preference=random.choice(_NOTIFICATION_CHANNELS),
+    )
+
+
+@activity.defn
+async def get_order_bundle(order_id: str) -> OrderBundle:
+    """
+    Get order details and the user and vendor preferences from the database
+    in a single activity.
+    """
+    activity.logger.info("Retrieving order bundle from database. order_id=%s", order_id)
+    # The preferences are keyed by the vendor and user of the order, so they are
+    # fetched, concurrently, once the order details are known
+    order_details = await get_order_details(order_id)
+    vendor_preference, user_preference = await asyncio.gather(
+        get_vendor_preference(order_details.vendor_id),
+        get_user_preference(order_details.user_id),
+    )
+    return OrderBundle(
+        order=order_details,
+        vendor=vendor_preference,
+        user=user_preference,
     )
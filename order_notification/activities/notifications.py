@@ -1,4 +1,5 @@
 import asyncio
+import time
 from datetime import timedelta
 
 from temporalio import activity, workflow
@@ -12,6 +13,9 @@ from order_notification.schemas.notification import (
     VendorNotificationMessageType,
 )
 
+_NOTIFY_START_TO_CLOSE_TIMEOUT = timedelta(seconds=10)
+_NOTIFY_RETRY_POLICY = RetryPolicy(maximum_interval=timedelta(seconds=5))
+
 
 # TODO(kawo): change activity argument to pydantic model
 @activity.defn
@@ -21,18 +25,20 @@ async def notify_user_sms(
     """
     Send a SMS notification to an user about an order.
     """
-    activity.logger.info(
+    activity.logger.debug(
         "Sending a SMS notification to user for order. order_id=%s. user_id=%s. message=%s",
         arg.order_id,
         arg.user_id,
         arg.message,
     )
+    start = time.monotonic()
     await asyncio.sleep(0.5)
     activity.logger.info(
-        "SMS notification is sent to user for order. order_id=%s. user_id=%s. message=%s",
+        "SMS notification is sent to user for order. order_id=%s. user_id=%s. message=%s. duration_ms=%d",
         arg.order_id,
         arg.user_id,
         arg.message,
+        (time.monotonic() - start) * 1000,
     )
 
 
@@ -43,21 +49,29 @@ async def notify_user_push(
     """
     Send a push notification to the user about an order.
     """
-    activity.logger.info(
+    activity.logger.debug(
         "Sending a push notification to user for order. order_id=%s. user_id=%s. message=%s",
         arg.order_id,
         arg.user_id,
         arg.message,
     )
+    start = time.monotonic()
     await asyncio.sleep(0.5)
     activity.logger.info(
-        "Push notification is sent to user for order. order_id=%s. user_id=%s. message=%s",
+        "Push notification is sent to user for order. order_id=%s. user_id=%s. message=%s. duration_ms=%d",
         arg.order_id,
         arg.user_id,
         arg.message,
+        (time.monotonic() - start) * 1000,
     )
 
 
+_USER_NOTIFY_ACTIVITIES = {
+    NotificationChannelType.PUSH: notify_user_push,
+    NotificationChannelType.SMS: notify_user_sms,
+}
+
+
 async def notify_user(
     arg: UserNotificationInput,
 ) -> None:
@@ -69,21 +83,15 @@ async def notify_user(
         arg.user_id,
         arg.user_notification_preference,
     )
-    match arg.user_notification_preference:
-        case NotificationChannelType.PUSH:
-            await workflow.execute_activity(
-                notify_user_push,
-                arg,
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-            )
-        case NotificationChannelType.SMS:
-            await workflow.execute_activity(
-                notify_user_sms,
-                arg,
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-            )
+    notify_activity = _USER_NOTIFY_ACTIVITIES.get(arg.user_notification_preference)
+    if notify_activity is None:
+        return
+    await workflow.execute_activity(
+        notify_activity,
+        arg,
+        start_to_close_timeout=_NOTIFY_START_TO_CLOSE_TIMEOUT,
+        retry_policy=_NOTIFY_RETRY_POLICY,
+    )
 
 
 @activity.defn
@@ -93,18 +101,20 @@ async def notify_vendor_sms(
     """
     Send a SMS notification to the vendor about an order.
     """
-    activity.logger.info(
+    activity.logger.debug(
         "Sending a SMS notification to vendor for order. order_id=%s. vendor_id=%s. message=%s",
         arg.order_id,
         arg.vendor_id,
         arg.message,
     )
+    start = time.monotonic()
     await asyncio.sleep(0.5)
     activity.logger.info(
-        "SMS notification is sent to vendor for order. order_id=%s. vendor_id=%s. message=%s",
+        "SMS notification is sent to vendor for order. order_id=%s. vendor_id=%s. message=%s. duration_ms=%d",
         arg.order_id,
         arg.vendor_id,
         arg.message,
+        (time.monotonic() - start) * 1000,
     )
 
 
@@ -115,21 +125,29 @@ async def notify_vendor_push(
     """
     Send a push notification to the vendor about an order.
     """
-    activity.logger.info(
+    activity.logger.debug(
         "Sending a push notification to vendor for order. order_id=%s. vendor_id=%s. message=%s",
         arg.order_id,
         arg.vendor_id,
         arg.message,
     )
+    start = time.monotonic()
     await asyncio.sleep(0.5)
     activity.logger.info(
-        "Push notification is sent to vendor for order. order_id=%s. vendor_id=%s. message=%s",
+        "Push notification is sent to vendor for order. order_id=%s. vendor_id=%s. message=%s. duration_ms=%d",
         arg.order_id,
         arg.vendor_id,
         arg.message,
+        (time.monotonic() - start) * 1000,
     )
 
 
+_VENDOR_NOTIFY_ACTIVITIES = {
+    NotificationChannelType.PUSH: notify_vendor_push,
+    NotificationChannelType.SMS: notify_vendor_sms,
+}
+
+
 async def notify_vendor(
     arg: VendorNotificationInput,
 ) -> None:
@@ -141,18 +159,12 @@ async def notify_vendor(
         arg.vendor_id,
         arg.vendor_notification_preference,
     )
-    match arg.vendor_notification_preference:
-        case NotificationChannelType.PUSH:
-            await workflow.execute_activity(
-                notify_vendor_push,
-                arg,
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-            )
-        case NotificationChannelType.SMS:
-            await workflow.execute_activity(
-                notify_vendor_sms,
-                arg,
-                start_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-            )
+    notify_activity = _VENDOR_NOTIFY_ACTIVITIES.get(arg.vendor_notification_preference)
+    if notify_activity is None:
+        return
+    await workflow.execute_activity(
+        notify_activity,
+        arg,
+        start_to_close_timeout=_NOTIFY_START_TO_CLOSE_TIMEOUT,
+        retry_policy=_NOTIFY_RETRY_POLICY,
+    )
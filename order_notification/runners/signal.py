@@ -3,23 +3,30 @@ Signal runner.
 """
 
 import asyncio
+from typing import List
 
 from common.python.client import TemporalClientFactory
 from order_notification.workflows.orders import Orders
 
 
-async def main():
+async def run_many(order_ids: List[str]) -> None:
+    """
+    Signal many orders concurrently over a single client connection.
+    """
     client = await TemporalClientFactory.create_client()
 
-    handle = client.get_workflow_handle_for(
-        Orders.run,
-        "dummy-order-id",
-    )
-    await handle.signal(Orders.accept_order)
-    # await handle.signal(Orders.prepare_order)
-    # await handle.signal(Orders.ready_order)
-    # await handle.signal(Orders.pick_up_order)
-    # await handle.signal(Orders.decline_order)
+    handles = [
+        client.get_workflow_handle_for(Orders.run, order_id) for order_id in order_ids
+    ]
+    await asyncio.gather(*(handle.signal(Orders.accept_order) for handle in handles))
+    # await asyncio.gather(*(handle.signal(Orders.prepare_order) for handle in handles))
+    # await asyncio.gather(*(handle.signal(Orders.ready_order) for handle in handles))
+    # await asyncio.gather(*(handle.signal(Orders.pick_up_order) for handle in handles))
+    # await asyncio.gather(*(handle.signal(Orders.decline_order) for handle in handles))
+
+
+async def main():
+    await run_many(["dummy-order-id"])
 
 
 if __name__ == "__main__":
@@ -9,11 +9,7 @@ from temporalio.worker import Worker
 
 from common.python.client import TemporalClientFactory
 from common.python.constants import ORDER_NOTIFICATION_TASK_QUEUE
-from order_notification.activities.database import (
-    get_order_details,
-    get_user_preference,
-    get_vendor_preference,
-)
+from order_notification.activities.database import get_order_bundle
 from order_notification.activities.notifications import (
     notify_user_push,
     notify_user_sms,
@@ -33,9 +29,7 @@ async def main():
         task_queue=ORDER_NOTIFICATION_TASK_QUEUE,
         workflows=[Orders],
         activities=[
-            get_order_details,
-            get_user_preference,
-            get_vendor_preference,
+            get_order_bundle,
             notify_user_push,
             notify_user_sms,
             notify_vendor_push,
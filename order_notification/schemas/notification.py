@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class NotificationChannelType(StrEnum):
@@ -21,6 +21,8 @@ class UserNotificationMessageType(StrEnum):
 
 
 class UserNotificationInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     order_id: str
     user_id: str
     message: UserNotificationMessageType
@@ -28,6 +30,8 @@ class UserNotificationInput(BaseModel):
 
 
 class VendorNotificationInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     order_id: str
     vendor_id: str
     message: VendorNotificationMessageType
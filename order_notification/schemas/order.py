@@ -4,9 +4,12 @@ Schema for order notification workflow.
 
 from datetime import datetime
 from enum import StrEnum
-from typing import List
+from typing import FrozenSet
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from order_notification.schemas.user import UserPreference
+from order_notification.schemas.vendor import VendorPreference
 
 
 class OrderState(StrEnum):
@@ -25,26 +28,22 @@ class OrderState(StrEnum):
     @property
     def description(self) -> str:
         """Returns a human-readable description of the state."""
-        return _STATE_DESCRIPTIONS.get(self, "Unknown state")
+        return self._description
 
     @property
     def is_terminal_state(self) -> bool:
         """Checks if the current state is a terminal state."""
-        return self in {OrderState.ORDER_PICKED_UP, OrderState.ORDER_DECLINED}
+        return self._is_terminal_state
 
     @property
     def requires_vendor_action(self) -> bool:
         """Checks if the current state requires vendor action."""
-        return self in {
-            OrderState.VENDOR_NOTIFIED,
-            OrderState.ORDER_PREPARATION,
-            OrderState.ORDER_READY,
-        }
+        return self._requires_vendor_action
 
     @property
-    def allowed_next_states(self) -> List["OrderState"]:
-        """Returns a list of valid next states from the current state."""
-        return _STATE_TRANSITIONS.get(self, [])
+    def allowed_next_states(self) -> FrozenSet["OrderState"]:
+        """Returns the set of valid next states from the current state."""
+        return self._allowed_next_states
 
     def can_transition_to(self, next_state: "OrderState") -> bool:
         """
@@ -56,7 +55,7 @@ class OrderState(StrEnum):
         Returns:
             bool: Whether the transition is valid
         """
-        return next_state in self.allowed_next_states
+        return bool(self._allowed_next_mask & next_state._bit)
 
 
 # State descriptions for human-readable output
@@ -72,24 +71,52 @@ _STATE_DESCRIPTIONS = {
 
 # Valid state transitions
 _STATE_TRANSITIONS = {
-    OrderState.ORDER_PLACED: [OrderState.VENDOR_NOTIFIED],
-    OrderState.VENDOR_NOTIFIED: [
-        OrderState.ORDER_ACCEPTED,
-        OrderState.ORDER_DECLINED,
-    ],
-    OrderState.ORDER_ACCEPTED: [OrderState.ORDER_PREPARATION],
-    OrderState.ORDER_PREPARATION: [OrderState.ORDER_READY],
-    OrderState.ORDER_READY: [OrderState.ORDER_PICKED_UP],
-    OrderState.ORDER_PICKED_UP: [],  # Terminal state
-    OrderState.ORDER_DECLINED: [],  # Terminal state
+    OrderState.ORDER_PLACED: frozenset({OrderState.VENDOR_NOTIFIED}),
+    OrderState.VENDOR_NOTIFIED: frozenset(
+        {
+            OrderState.ORDER_ACCEPTED,
+            OrderState.ORDER_DECLINED,
+        }
+    ),
+    OrderState.ORDER_ACCEPTED: frozenset({OrderState.ORDER_PREPARATION}),
+    OrderState.ORDER_PREPARATION: frozenset({OrderState.ORDER_READY}),
+    OrderState.ORDER_READY: frozenset({OrderState.ORDER_PICKED_UP}),
+    OrderState.ORDER_PICKED_UP: frozenset(),  # Terminal state
+    OrderState.ORDER_DECLINED: frozenset(),  # Terminal state
 }
 
+_TERMINAL_STATES = frozenset({OrderState.ORDER_PICKED_UP, OrderState.ORDER_DECLINED})
+
+_VENDOR_ACTION_STATES = frozenset(
+    {
+        OrderState.VENDOR_NOTIFIED,
+        OrderState.ORDER_PREPARATION,
+        OrderState.ORDER_READY,
+    }
+)
+
+# Precompute the properties on each member since they only depend on the member itself.
+# Each member also gets a distinct bit so transition checks are a single bitwise AND.
+for _index, _state in enumerate(OrderState):
+    _state._bit = 1 << _index
+for _state in OrderState:
+    _state._description = _STATE_DESCRIPTIONS.get(_state, "Unknown state")
+    _state._is_terminal_state = _state in _TERMINAL_STATES
+    _state._requires_vendor_action = _state in _VENDOR_ACTION_STATES
+    _state._allowed_next_states = _STATE_TRANSITIONS.get(_state, frozenset())
+    _state._allowed_next_mask = sum(
+        _next_state._bit for _next_state in _state._allowed_next_states
+    )
+del _index, _state
+
 
 class OrderWorkflowInput(BaseModel):
     """
     Input for the order workflow.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     order_id: str
     expiration_time: int = 60  # in seconds; 1 minute expiration time by default
 
@@ -99,7 +126,21 @@ class OrderDetails(BaseModel):
     Order details.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     order_id: str
     user_id: str
     vendor_id: str
     order_date: datetime
+
+
+class OrderBundle(BaseModel):
+    """
+    Order details together with the user and vendor notification preferences.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    order: OrderDetails
+    vendor: VendorPreference
+    user: UserPreference
@@ -2,7 +2,7 @@
 Schema for order notification workflow.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from order_notification.schemas.notification import NotificationChannelType
 
@@ -12,5 +12,7 @@ class UserPreference(BaseModel):
     User notification preferences.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     notification_preference: NotificationChannelType = NotificationChannelType.PUSH
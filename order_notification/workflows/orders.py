@@ -3,8 +3,9 @@ Order notification workflow.
 """
 
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Callable
+from typing import Callable, Deque
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
@@ -16,23 +17,40 @@ from order_notification.schemas.notification import (
 
 # Import activity, passing it through the sandbox without reloading the module
 with workflow.unsafe.imports_passed_through():
-    from order_notification.activities.database import (
-        get_order_details,
-        get_user_preference,
-        get_vendor_preference,
-    )
+    from order_notification.activities.database import get_order_bundle
     from order_notification.activities.notifications import notify_user, notify_vendor
     from order_notification.schemas.notification import (
         UserNotificationMessageType,
         VendorNotificationMessageType,
     )
     from order_notification.schemas.order import (
-        OrderDetails,
+        OrderBundle,
         OrderState,
         OrderWorkflowInput,
     )
-    from order_notification.schemas.user import UserPreference
-    from order_notification.schemas.vendor import VendorPreference
+
+_ACTIVITY_TIMEOUT = timedelta(seconds=10)
+_ACTIVITY_RETRY_POLICY = RetryPolicy(maximum_interval=timedelta(seconds=5))
+
+# User notification and log description for each state handled by the main loop
+_USER_NOTIFICATIONS = {
+    OrderState.ORDER_ACCEPTED: (
+        UserNotificationMessageType.ORDER_ACCEPTED,
+        "Order accepted",
+    ),
+    OrderState.ORDER_PREPARATION: (
+        UserNotificationMessageType.ORDER_BEING_PREPARED,
+        "Order is being prepared",
+    ),
+    OrderState.ORDER_READY: (
+        UserNotificationMessageType.ORDER_READY,
+        "Order is ready",
+    ),
+    OrderState.ORDER_DECLINED: (
+        UserNotificationMessageType.ORDER_CANCELED,
+        "Order declined",
+    ),
+}
 
 
 @workflow.defn
@@ -45,8 +63,12 @@ class Orders:
     def __init__(self, arg: OrderWorkflowInput) -> None:
         self.order_state: OrderState = OrderState.ORDER_PLACED
         self.order_start_time: datetime = workflow.now()
-        self.is_new_state: bool = False
+        # State transitions not yet handled by the main loop, in arrival order
+        self.pending_states: Deque[OrderState] = deque()
         self.order_expiration_time: timedelta = timedelta(seconds=arg.expiration_time)
+        self.order_deadline: datetime = (
+            self.order_start_time + self.order_expiration_time
+        )
 
     @workflow.run
     async def run(self, arg: OrderWorkflowInput) -> OrderState:
@@ -55,25 +77,29 @@ class Orders:
         """
         workflow.logger.info("Placing an order. order_id=%s", arg.order_id)
 
-        # 1. Retrieve order details from database
-        order_details: OrderDetails = await workflow.execute_activity(
-            get_order_details,
+        # 1. Retrieve order details, and vendor and user notification preferences
+        # from database in a single activity
+        order_bundle: OrderBundle = await workflow.execute_activity(
+            get_order_bundle,
             arg.order_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
-
-        # 2. Retrieve vendor notification preference from database
-        vendor_preference: VendorPreference = await workflow.execute_activity(
-            get_vendor_preference,
-            arg.order_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-        )
-
-        # 3. Sends notification to vendor based on their preferences
+        order_details = order_bundle.order
+        vendor_preference = order_bundle.vendor
+        user_preference = order_bundle.user
+
+        # Notification inputs are built from already-validated activity results,
+        # so skip pydantic validation with `model_construct`
+        user_notification_fields = {
+            "order_id": arg.order_id,
+            "user_id": order_details.user_id,
+            "user_notification_preference": user_preference.notification_preference,
+        }
+
+        # 2. Sends notification to vendor based on their preferences
         await notify_vendor(
-            VendorNotificationInput(
+            VendorNotificationInput.model_construct(
                 order_id=arg.order_id,
                 vendor_id=order_details.vendor_id,
                 vendor_notification_preference=vendor_preference.notification_preference,
@@ -88,105 +114,45 @@ class Orders:
             order_details.vendor_id,
         )
 
-        # 4. Retrieve user notification preference from database
-        user_preference: UserPreference = await workflow.execute_activity(
-            get_user_preference,
-            arg.order_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(maximum_interval=timedelta(seconds=5)),
-        )
-
-        remaining_expiration_time = self.order_expiration_time
         while True:
-            # 5. Wait for order state transitions
-            remaining_expiration_time = await self._wait_with_expiration(
-                lambda: self.is_new_state,
-                expiration_time=remaining_expiration_time,
+            # 3. Wait for order state transitions
+            await self._wait_with_expiration(self._has_pending_states)
+
+            # Handle transitions in arrival order so none is lost. An unexpected
+            # state is handled like a decline, which ends the workflow
+            state = self.pending_states.popleft()
+            if state not in _USER_NOTIFICATIONS:
+                state = OrderState.ORDER_DECLINED
+            message, description = _USER_NOTIFICATIONS[state]
+            workflow.logger.info(
+                "%s. order_id=%s. vendor_id=%s",
+                description,
+                arg.order_id,
+                order_details.vendor_id,
             )
-            workflow.logger.warning(
-                "Remaining expiration time: %s", remaining_expiration_time
+            await notify_user(
+                UserNotificationInput.model_construct(
+                    **user_notification_fields, message=message
+                )
             )
-
-            match self.order_state:
-                case OrderState.ORDER_ACCEPTED:
-                    # If the order is accepted, then notify the user
-                    workflow.logger.info(
-                        "Order accepted. order_id=%s. vendor_id=%s",
-                        arg.order_id,
-                        order_details.vendor_id,
-                    )
-                    await notify_user(
-                        UserNotificationInput(
-                            order_id=arg.order_id,
-                            user_id=order_details.user_id,
-                            user_notification_preference=user_preference.notification_preference,
-                            message=UserNotificationMessageType.ORDER_ACCEPTED,
-                        )
-                    )
-                case OrderState.ORDER_PREPARATION:
-                    # If the order is being prepared, then notify the user
-                    workflow.logger.info(
-                        "Order is being prepared. order_id=%s. vendor_id=%s",
-                        arg.order_id,
-                        order_details.vendor_id,
-                    )
-                    await notify_user(
-                        UserNotificationInput(
-                            order_id=arg.order_id,
-                            user_id=order_details.user_id,
-                            user_notification_preference=user_preference.notification_preference,
-                            message=UserNotificationMessageType.ORDER_BEING_PREPARED,
-                        )
-                    )
-                case OrderState.ORDER_READY:
-                    # If the order is ready, then notify the user
-                    workflow.logger.info(
-                        "Order is ready. order_id=%s. vendor_id=%s",
-                        arg.order_id,
-                        order_details.vendor_id,
-                    )
-                    await notify_user(
-                        UserNotificationInput(
-                            order_id=arg.order_id,
-                            user_id=order_details.user_id,
-                            user_notification_preference=user_preference.notification_preference,
-                            message=UserNotificationMessageType.ORDER_READY,
-                        )
-                    )
-                    break
-                case OrderState.ORDER_DECLINED | _:
-                    # If the order is declined or in an unexpected state,
-                    # then notify the user, and end the workflow
-                    workflow.logger.info(
-                        "Order declined. order_id=%s. vendor_id=%s", arg.order_id
-                    )
-                    await notify_user(
-                        UserNotificationInput(
-                            order_id=arg.order_id,
-                            user_id=order_details.user_id,
-                            user_notification_preference=user_preference.notification_preference,
-                            message=UserNotificationMessageType.ORDER_CANCELED,
-                        )
-                    )
-                    return self.order_state
-
-            self.is_new_state = False
+            if state.is_terminal_state:
+                return self.order_state
+            if state is OrderState.ORDER_READY:
+                break
         # end while
 
-        # 6. Wait for the order to be picked up
-        await workflow.wait_condition(
-            lambda: self.order_state == OrderState.ORDER_PICKED_UP,
-        )
+        # 4. Wait for the order to be picked up, unless it already was while
+        # the loop was handling earlier transitions
+        if not self._is_picked_up():
+            await workflow.wait_condition(self._is_picked_up)
         workflow.logger.info(
             "Order completed. order_id=%s. vendor_id=%s",
             arg.order_id,
             order_details.vendor_id,
         )
         await notify_user(
-            UserNotificationInput(
-                order_id=arg.order_id,
-                user_id=order_details.user_id,
-                user_notification_preference=user_preference.notification_preference,
+            UserNotificationInput.model_construct(
+                **user_notification_fields,
                 message=UserNotificationMessageType.ORDER_COMPLETED,
             )
         )
@@ -197,62 +163,60 @@ class Orders:
         """
         A signal to accepts an order.
         """
-        workflow.logger.info("Accepting an order. state=%s", self.order_state)
-        # If the order state can be transitioned, then transition the order state to ORDER_ACCEPTED
-        if OrderState.ORDER_ACCEPTED in self.order_state.allowed_next_states:
-            self.order_state = OrderState.ORDER_ACCEPTED
-            self.is_new_state = True
+        self._try_transition(OrderState.ORDER_ACCEPTED)
 
     @workflow.signal
     def decline_order(self) -> None:
         """
         A signal to decline an order.
         """
-        workflow.logger.info("Declining an order. state=%s", self.order_state)
-        # If the order state can be transitioned, then transition the order state to ORDER_ACCEPTED
-        if OrderState.ORDER_DECLINED in self.order_state.allowed_next_states:
-            self.order_state = OrderState.ORDER_DECLINED
-            self.is_new_state = True
+        self._try_transition(OrderState.ORDER_DECLINED)
 
     @workflow.signal
     def prepare_order(self) -> None:
         """
         A signal to indicate order is being prepared.
         """
-        workflow.logger.info(
-            "Transitioning an order to preparation. state=%s", self.order_state
-        )
-        # If the order state can be transitioned, then set the order state to ORDER_PREPARATION
-        if OrderState.ORDER_PREPARATION in self.order_state.allowed_next_states:
-            self.order_state = OrderState.ORDER_PREPARATION
-            self.is_new_state = True
+        self._try_transition(OrderState.ORDER_PREPARATION)
 
     @workflow.signal
     def ready_order(self) -> None:
         """
         A signal to indicate order is ready.
         """
-        workflow.logger.info(
-            "Transitioning an order to ready. state=%s",
-            self.order_state,
-        )
-        # If the order state can be transitioned, then set the order state to ORDER_READY
-        if OrderState.ORDER_READY in self.order_state.allowed_next_states:
-            self.order_state = OrderState.ORDER_READY
-            self.is_new_state = True
+        self._try_transition(OrderState.ORDER_READY)
 
     @workflow.signal
     def pick_up_order(self) -> None:
         """
         A signal to indicate order is picked up.
         """
+        self._try_transition(OrderState.ORDER_PICKED_UP)
+
+    def _has_pending_states(self) -> bool:
+        """
+        Whether there are state transitions waiting to be handled.
+        """
+        return bool(self.pending_states)
+
+    def _is_picked_up(self) -> bool:
+        """
+        Whether the order has been picked up.
+        """
+        return self.order_state == OrderState.ORDER_PICKED_UP
+
+    def _try_transition(self, next_state: OrderState) -> None:
+        """
+        Transition the order to the given state if it is allowed from the current state.
+        """
         workflow.logger.info(
-            "Transitioning an order to picked up. state=%s", self.order_state
+            "Transitioning an order. state=%s. next_state=%s",
+            self.order_state,
+            next_state,
         )
-        # If the order state can be transitioned, then set the order state to ORDER_COMPLETED
-        if OrderState.ORDER_PICKED_UP in self.order_state.allowed_next_states:
-            self.order_state = OrderState.ORDER_PICKED_UP
-            self.is_new_state = True
+        if self.order_state.can_transition_to(next_state):
+            self.order_state = next_state
+            self.pending_states.append(next_state)
 
     @workflow.query
     def query_order_state(self) -> OrderState:
@@ -261,30 +225,29 @@ class Orders:
         """
         return self.order_state
 
-    async def _wait_with_expiration(
-        self, f: Callable[[], bool], expiration_time: timedelta
-    ) -> timedelta:
+    async def _wait_with_expiration(self, f: Callable[[], bool]) -> None:
         """
-        A helper function to wait for a condition with a timeout.
+        A helper function to wait for a condition until the order expires.
         """
+        # A transition may already be queued after the deadline passed, e.g. while a
+        # slow user notification ran, so it is handled before expiring the order
+        if f():
+            return
         try:
-            await workflow.wait_condition(f, timeout=expiration_time)
+            await workflow.wait_condition(
+                f, timeout=max(timedelta(0), self.order_deadline - workflow.now())
+            )
         except asyncio.TimeoutError:
             # Given the order has expired, transition order to declined if it is possible
-            if OrderState.ORDER_DECLINED in self.order_state.allowed_next_states:
+            if self.order_state.can_transition_to(OrderState.ORDER_DECLINED):
                 self.order_state = OrderState.ORDER_DECLINED
             else:
                 # If the order cannot be declined (because it has been accepted by vendor),
                 # then transition the order to ready
                 self.order_state = OrderState.ORDER_READY
+            self.pending_states.append(self.order_state)
 
             workflow.logger.info(
                 "Order expired. Transition to new order state. state=%s",
                 self.order_state,
             )
-
-        # Calculate and return the remaining expiration time based on the current time
-        remaining_expiration_time = self.order_expiration_time - (
-            workflow.now() - workflow.info().start_time
-        )
-        return remaining_expiration_time
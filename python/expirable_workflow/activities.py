@@ -6,6 +6,8 @@ import asyncio
 
 from temporalio import activity
 
+from python.expirable_workflow.schemas import PaymentProcessingResult
+
 
 @activity.defn
 async def validate_payment(payment_id: str, amount: float) -> bool:
@@ -84,3 +86,33 @@ async def notify_customer(payment_id: str, transaction_id: str) -> None:
         payment_id,
         transaction_id,
     )
+
+
+@activity.defn
+async def process_payment(payment_id: str, amount: float) -> PaymentProcessingResult:
+    """
+    Validates, fraud checks, accepts and notifies the customer about the payment
+    in a single activity, to save the round-trips of scheduling each step.
+
+    Heartbeats between steps, since cancellation only reaches an activity through
+    its heartbeats. Once the workflow expires, the next step is cancelled instead
+    of charging or notifying the customer.
+    """
+    is_valid, is_not_fraudulent = await asyncio.gather(
+        validate_payment(payment_id, amount),
+        check_fraud(payment_id, amount),
+    )
+    if not is_valid or not is_not_fraudulent:
+        return PaymentProcessingResult(
+            is_valid=is_valid, is_not_fraudulent=is_not_fraudulent
+        )
+
+    activity.heartbeat("accept")
+    transaction_id = await accept_payment(payment_id, amount)
+    activity.heartbeat("notify")
+    await notify_customer(payment_id, transaction_id)
+    return PaymentProcessingResult(
+        is_valid=is_valid,
+        is_not_fraudulent=is_not_fraudulent,
+        transaction_id=transaction_id,
+    )
@@ -19,7 +19,7 @@ class PaymentStatus(str, Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentWorkflowInput:
     """Input for the expirable payment workflow."""
 
@@ -27,12 +27,25 @@ class PaymentWorkflowInput:
     amount: float
     # Number of seconds until the workflow expires, 5 seconds by default
     expire_in: int = 5
+    # Run all payment steps in one activity; set to False to schedule each step
+    # as its own activity, which allows per-step status and cancellation
+    single_activity: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentWorkflowResult:
     """Result of the expirable payment workflow."""
 
     payment_id: str
     status: PaymentStatus
     message: str
+
+
+@dataclass(slots=True)
+class PaymentProcessingResult:
+    """Result of processing all payment steps in a single activity."""
+
+    is_valid: bool
+    is_not_fraudulent: bool
+    # Only set once the payment has been accepted
+    transaction_id: str | None = None
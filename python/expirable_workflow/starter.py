@@ -79,7 +79,7 @@ async def demo_successful_completion():
     """
     Demo: Workflow completes before expiration.
 
-    The payment processing takes ~4 seconds total, so with a 10-second
+    The payment processing takes ~3 seconds total, so with a 10-second
     expiration, it should complete successfully.
     """
     print("\n" + "=" * 60)
@@ -92,13 +92,13 @@ async def demo_expiration():
     """
     Demo: Workflow expires before completion.
 
-    The payment processing takes ~4 seconds total, so with a 3-second
+    The payment processing takes ~3 seconds total, so with a 2-second
     expiration, it should expire before completing.
     """
     print("\n" + "=" * 60)
     print("DEMO 2: Workflow that expires before completion")
     print("=" * 60)
-    await run_workflow(expire_in=3, amount=100.0)
+    await run_workflow(expire_in=2, amount=100.0)
 
 
 async def main():
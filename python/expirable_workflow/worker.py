@@ -12,6 +12,7 @@ from python.expirable_workflow.activities import (
     accept_payment,
     check_fraud,
     notify_customer,
+    process_payment,
     validate_payment,
 )
 from python.expirable_workflow.workflow import ExpirablePaymentWorkflow
@@ -33,6 +34,7 @@ async def main():
             check_fraud,
             accept_payment,
             notify_customer,
+            process_payment,
         ],
     )
     print("\nExpirable Payment Worker started, ctrl+c to exit\n")
@@ -18,14 +18,35 @@ with workflow.unsafe.imports_passed_through():
         accept_payment,
         check_fraud,
         notify_customer,
+        process_payment,
         validate_payment,
     )
     from python.expirable_workflow.schemas import (
+        PaymentProcessingResult,
         PaymentStatus,
         PaymentWorkflowInput,
         PaymentWorkflowResult,
     )
 
+_ACTIVITY_TIMEOUT = timedelta(seconds=30)
+_SINGLE_ACTIVITY_TIMEOUT = timedelta(seconds=20)
+# Longer than any single step of `process_payment`, which heartbeats between steps.
+# Heartbeats are throttled to a fraction of this, so it is kept short for the
+# expiration's cancellation to reach the activity promptly.
+_SINGLE_ACTIVITY_HEARTBEAT_TIMEOUT = timedelta(seconds=2)
+_ACTIVITY_RETRY_POLICY = RetryPolicy(maximum_interval=timedelta(seconds=5))
+
+_VALIDATION_FAILED_MESSAGE = "Payment validation failed"
+_FRAUD_FLAGGED_MESSAGE = "Payment flagged as potentially fraudulent"
+_EXPIRED_MESSAGE = "Payment workflow expired"
+
+# Checks run concurrently before a payment is accepted, in the order their failures
+# are reported, each with the message used when it fails
+_PAYMENT_CHECKS = (
+    (validate_payment, _VALIDATION_FAILED_MESSAGE),
+    (check_fraud, _FRAUD_FLAGGED_MESSAGE),
+)
+
 
 @workflow.defn
 class ExpirablePaymentWorkflow:
@@ -43,6 +64,7 @@ class ExpirablePaymentWorkflow:
         self.payment_id = input.payment_id
         self.amount = input.amount
         self.expire_in = input.expire_in
+        self.single_activity = input.single_activity
         self.status = PaymentStatus.PENDING
         self.is_expired = False
 
@@ -51,8 +73,8 @@ class ExpirablePaymentWorkflow:
         """
         Main workflow execution.
 
-        Races the payment processing against an expiration timer.
-        If the timer wins, the workflow cancels itself.
+        Runs the payment processing under an expiration timer.
+        If the timer fires first, it cancels the payment and the workflow expires.
         """
         workflow.logger.info(
             "Starting expirable payment workflow. payment_id=%s, expire_in=%d seconds",
@@ -60,150 +82,166 @@ class ExpirablePaymentWorkflow:
             self.expire_in,
         )
 
-        # Create the payment processing task
-        payment_task = asyncio.create_task(self._process_payment())
-
-        # Create the expiration timer task
-        expiration_task = asyncio.create_task(self._expiration_timer())
-
-        # Race the two tasks - wait for whichever completes first
-        done, pending = await asyncio.wait(
-            [payment_task, expiration_task],
-            return_when=asyncio.FIRST_COMPLETED,
+        # Schedule a single timer that cancels this run, and therefore the payment
+        # it is awaiting, on expiration
+        workflow.logger.info(
+            "Expiration timer started. payment_id=%s, expire_in=%d seconds",
+            self.payment_id,
+            self.expire_in,
+        )
+        expiration_timer = asyncio.get_running_loop().call_later(
+            self.expire_in, self._expire, asyncio.current_task()
         )
 
-        # Cancel any pending tasks
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-
-        if expiration_task in done:
-            self.is_expired = True
-            workflow.logger.warning(
-                "Payment workflow expired. payment_id=%s", self.payment_id
-            )
-            return PaymentWorkflowResult(
-                payment_id=self.payment_id,
-                status=self.status,
-                message="Payment workflow expired",
-            )
+        # Cancellations other than the expiration, such as a cancel request for the
+        # workflow, propagate as usual
+        try:
+            return await self._process_payment()
+        except asyncio.CancelledError:
+            if not self.is_expired:
+                raise
+        except ActivityError as e:
+            if not self.is_expired or type(e.cause) is not CancelledError:
+                raise
+        finally:
+            expiration_timer.cancel()
 
-        return payment_task.result()
+        self.status = PaymentStatus.CANCELLED
+        workflow.logger.warning(
+            "Payment workflow expired. payment_id=%s", self.payment_id
+        )
+        return PaymentWorkflowResult(
+            payment_id=self.payment_id,
+            status=self.status,
+            message=_EXPIRED_MESSAGE,
+        )
 
-    async def _expiration_timer(self) -> None:
+    def _expire(self, run_task: asyncio.Task) -> None:
         """
-        Timer that fires after the expiration duration.
+        Timer callback that cancels the payment once the expiration duration passes.
         """
-        workflow.logger.info(
-            "Expiration timer started. payment_id=%s, expire_in=%d seconds",
-            self.payment_id,
-            self.expire_in,
-        )
-        await asyncio.sleep(self.expire_in)
         workflow.logger.info("Expiration timer fired! payment_id=%s", self.payment_id)
+        self.is_expired = True
+        run_task.cancel()
 
     async def _process_payment(self) -> PaymentWorkflowResult:
         """
         Main payment processing logic.
 
-        Steps:
-        1. Validate payment
-        2. Check for fraud
-        3. Accept payment
-        4. Notify customer
+        Unless `single_activity` is disabled, all steps run in one activity.
+        Otherwise, the steps are:
+        1. Validate payment and check for fraud, concurrently
+        2. Accept payment
+        3. Notify customer
         """
-        retry_policy = RetryPolicy(
-            maximum_interval=timedelta(seconds=5),
+        if self.single_activity:
+            return await self._process_payment_in_single_activity()
+
+        # Validation and fraud check are independent, so run them concurrently
+        self.status = PaymentStatus.VALIDATING
+        workflow.logger.info(
+            "Step 1: Validating payment and checking for fraud. payment_id=%s",
+            self.payment_id,
         )
-        try:
-            self.status = PaymentStatus.VALIDATING
-            workflow.logger.info(
-                "Step 1: Validating payment. payment_id=%s", self.payment_id
-            )
-            is_valid = await workflow.execute_activity(
-                validate_payment,
-                args=[self.payment_id, self.amount],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=retry_policy,
+        check_results = await asyncio.gather(
+            *(
+                workflow.execute_activity(
+                    check,
+                    args=[self.payment_id, self.amount],
+                    start_to_close_timeout=_ACTIVITY_TIMEOUT,
+                    retry_policy=_ACTIVITY_RETRY_POLICY,
+                )
+                for check, _ in _PAYMENT_CHECKS
             )
+        )
 
-            if not is_valid:
+        for passed, (_, failure_message) in zip(check_results, _PAYMENT_CHECKS):
+            if not passed:
                 self.status = PaymentStatus.CANCELLED
                 return PaymentWorkflowResult(
                     payment_id=self.payment_id,
                     status=self.status,
-                    message="Payment validation failed",
+                    message=failure_message,
                 )
 
-            self.status = PaymentStatus.FRAUD_CHECK
-            workflow.logger.info(
-                "Step 2: Checking for fraud. payment_id=%s", self.payment_id
-            )
-            is_not_fraudulent = await workflow.execute_activity(
-                check_fraud,
-                args=[self.payment_id, self.amount],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=retry_policy,
-            )
+        self.status = PaymentStatus.ACCEPTED
+        workflow.logger.info(
+            "Step 2: Accepting payment. payment_id=%s", self.payment_id
+        )
+        transaction_id = await workflow.execute_activity(
+            accept_payment,
+            args=[self.payment_id, self.amount],
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
+        )
 
-            if not is_not_fraudulent:
-                self.status = PaymentStatus.CANCELLED
-                return PaymentWorkflowResult(
-                    payment_id=self.payment_id,
-                    status=self.status,
-                    message="Payment flagged as potentially fraudulent",
-                )
+        self.status = PaymentStatus.NOTIFIED
+        workflow.logger.info(
+            "Step 3: Notifying customer. payment_id=%s", self.payment_id
+        )
+        await workflow.execute_activity(
+            notify_customer,
+            args=[self.payment_id, transaction_id],
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
+        )
 
-            self.status = PaymentStatus.ACCEPTED
-            workflow.logger.info(
-                "Step 3: Accepting payment. payment_id=%s", self.payment_id
-            )
-            transaction_id = await workflow.execute_activity(
-                accept_payment,
-                args=[self.payment_id, self.amount],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=retry_policy,
-            )
+        self.status = PaymentStatus.COMPLETED
+        workflow.logger.info(
+            "Payment workflow completed successfully. payment_id=%s, transaction_id=%s",
+            self.payment_id,
+            transaction_id,
+        )
 
-            self.status = PaymentStatus.NOTIFIED
-            workflow.logger.info(
-                "Step 4: Notifying customer. payment_id=%s", self.payment_id
-            )
-            await workflow.execute_activity(
-                notify_customer,
-                args=[self.payment_id, transaction_id],
-                start_to_close_timeout=timedelta(seconds=30),
-                retry_policy=retry_policy,
-            )
+        return PaymentWorkflowResult(
+            payment_id=self.payment_id,
+            status=self.status,
+            message=f"Payment completed successfully. Transaction ID: {transaction_id}",
+        )
 
-            self.status = PaymentStatus.COMPLETED
-            workflow.logger.info(
-                "Payment workflow completed successfully. payment_id=%s, transaction_id=%s",
-                self.payment_id,
-                transaction_id,
-            )
+    async def _process_payment_in_single_activity(self) -> PaymentWorkflowResult:
+        """
+        Process the payment with the single `process_payment` activity.
+        """
+        self.status = PaymentStatus.VALIDATING
+        workflow.logger.info(
+            "Processing payment in a single activity. payment_id=%s", self.payment_id
+        )
+        result: PaymentProcessingResult = await workflow.execute_activity(
+            process_payment,
+            args=[self.payment_id, self.amount],
+            start_to_close_timeout=_SINGLE_ACTIVITY_TIMEOUT,
+            heartbeat_timeout=_SINGLE_ACTIVITY_HEARTBEAT_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
+        )
 
+        if not result.is_valid:
+            self.status = PaymentStatus.CANCELLED
             return PaymentWorkflowResult(
                 payment_id=self.payment_id,
                 status=self.status,
-                message=f"Payment completed successfully. Transaction ID: {transaction_id}",
+                message=_VALIDATION_FAILED_MESSAGE,
             )
-        except asyncio.CancelledError:
+
+        if not result.is_not_fraudulent:
             self.status = PaymentStatus.CANCELLED
-            workflow.logger.warning(
-                "Payment workflow cancelled. payment_id=%s", self.payment_id
+            return PaymentWorkflowResult(
+                payment_id=self.payment_id,
+                status=self.status,
+                message=_FRAUD_FLAGGED_MESSAGE,
             )
-        except ActivityError as e:
-            if isinstance(e.cause, CancelledError):
-                self.status = PaymentStatus.CANCELLED
-                workflow.logger.warning(
-                    "Payment workflow cancelled. payment_id=%s", self.payment_id
-                )
-            else:
-                raise e
+
+        self.status = PaymentStatus.COMPLETED
+        workflow.logger.info(
+            "Payment workflow completed successfully. payment_id=%s, transaction_id=%s",
+            self.payment_id,
+            result.transaction_id,
+        )
+        return PaymentWorkflowResult(
+            payment_id=self.payment_id,
+            status=self.status,
+            message=f"Payment completed successfully. Transaction ID: {result.transaction_id}",
+        )
 
     @workflow.query
     def get_status(self) -> PaymentStatus:
@@ -18,9 +18,9 @@ To run this Workflow:
 
 import asyncio
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+import uvloop
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.worker import Worker
@@ -31,7 +31,7 @@ TASK_QUEUE = "interceptor-task-queue"
 
 
 @activity.defn
-def say_hello() -> None:
+async def say_hello() -> None:
     """
     A basic activity that says hello.
     """
@@ -59,6 +59,9 @@ async def main():
     """
     Main entry point.
     """
+    # Start tasks eagerly so those that complete without suspending skip the loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     import logging
 
     logging.basicConfig(level=logging.INFO)
@@ -72,7 +75,6 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[HelloWorkflow],
         activities=[say_hello],
-        activity_executor=ThreadPoolExecutor(5),
         interceptors=[BasicCustomWorkerInterceptor()],
     ):
         await client.execute_workflow(
@@ -83,4 +85,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    uvloop.run(main())
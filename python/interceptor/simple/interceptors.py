@@ -25,13 +25,13 @@ class CustomActivityInboundInterceptor(temporalio.worker.ActivityInboundIntercep
     async def execute_activity(
         self, input: temporalio.worker.ExecuteActivityInput
     ) -> Any:
+        # Skip looking up and formatting the activity info when INFO is disabled
+        if not self.logger.isEnabledFor(logging.INFO):
+            return await super().execute_activity(input)
+
         info = temporalio.activity.info()
-        self.logger.info("***** Start inbound interceptor *****")
-        self.logger.info("Activity info: %s", info)
-        self.logger.info("Input: %s", input)
-        result = await super().execute_activity(input)
-        self.logger.info("***** End inbound interceptor *****")
-        return result
+        self.logger.info("interceptor execute_activity info=%r input=%r", info, input)
+        return await super().execute_activity(input)
 
 
 class BasicCustomWorkerInterceptor(temporalio.worker.Interceptor):
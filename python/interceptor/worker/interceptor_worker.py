@@ -17,11 +17,10 @@ To run this Workflow:
 """
 
 import asyncio
-import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+import uvloop
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.common import RetryPolicy
@@ -33,7 +32,7 @@ TASK_QUEUE = "interceptor-task-queue"
 
 
 @activity.defn
-def say_hello_for_a_long_time(
+async def say_hello_for_a_long_time(
     greeting: str, iterations: int = 3, sleep: int = 1
 ) -> None:
     """
@@ -42,7 +41,7 @@ def say_hello_for_a_long_time(
     for i in range(iterations):
         activity.logger.info(f"{greeting} from Activity!")
         activity.heartbeat(i, sleep)
-        time.sleep(sleep)
+        await asyncio.sleep(sleep)
 
 
 @workflow.defn
@@ -102,6 +101,9 @@ async def main():
     """
     Main entry point.
     """
+    # Start tasks eagerly so those that complete without suspending skip the loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     import logging
 
     logging.basicConfig(level=logging.INFO)
@@ -115,7 +117,6 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[HelloWorkflow],
         activities=[say_hello_for_a_long_time],
-        activity_executor=ThreadPoolExecutor(5),
         interceptors=[BasicCustomWorkerInterceptor()],
     ):
         handle = await client.start_workflow(
@@ -132,4 +133,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    uvloop.run(main())
@@ -2,12 +2,22 @@
 Simple Activity Interceptor.
 """
 
+import inspect
 import logging
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 import temporalio
 
 
+def _log_call(logger: logging.Logger, method: str, input: Any) -> None:
+    """
+    Log an intercepted call as a single record, skipping the formatting of its input
+    when INFO is disabled.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("interceptor %s input=%r", method, input)
+
+
 class CustomActivityOutboundInterceptor(temporalio.worker.ActivityOutboundInterceptor):
     """
     A custom activity outbound interceptor.
@@ -23,17 +33,15 @@ class CustomActivityOutboundInterceptor(temporalio.worker.ActivityOutboundInterc
         super().__init__(next)
 
     def info(self) -> temporalio.activity.Info:
-        self.logger.info(">>>>> Start Activity Info interceptor >>>>>")
         info = super().info()
-        self.logger.info("Activity info: %s", info)
-        self.logger.info("<<<<< End Activity Info interceptor <<<<<")
+        self.logger.info("interceptor info result=%r", info)
         return info
 
     def heartbeat(self, *details: Any) -> None:
-        self.logger.info(">>>>> Start Activity Heartbeat interceptor >>>>>")
-        self.logger.info("Heartbeat details: %s", details)
+        # Heartbeats can be sent on every iteration of an activity, so keep them
+        # out of the INFO output
+        self.logger.debug("interceptor heartbeat details=%r", details)
         super().heartbeat(*details)
-        self.logger.info("<<<<< End Activity Heartbeat interceptor <<<<<")
 
 
 class CustomActivityInboundInterceptor(temporalio.worker.ActivityInboundInterceptor):
@@ -56,16 +64,55 @@ class CustomActivityInboundInterceptor(temporalio.worker.ActivityInboundIntercep
     async def execute_activity(
         self, input: temporalio.worker.ExecuteActivityInput
     ) -> Any:
-        self.logger.info(">>>>> Start execute Activity interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        result = await super().execute_activity(input)
-        self.logger.info("<<<<< End execute Activity interceptor <<<<<")
-        return result
+        _log_call(self.logger, "execute_activity", input)
+        return await super().execute_activity(input)
 
 
 ###
 
 
+def _make_logged_call(
+    logger: logging.Logger, method: str, target: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    """
+    Wrap an interceptor call so its input is logged at INFO before it is delegated to
+    `target`, and its result at DEBUG once it returns.
+    """
+    if inspect.iscoroutinefunction(target):
+
+        async def logged_async_call(input: Any) -> Any:
+            _log_call(logger, method, input)
+            result = await target(input)
+            logger.debug("interceptor %s result=%r", method, result)
+            return result
+
+        return logged_async_call
+
+    def logged_call(input: Any) -> Any:
+        _log_call(logger, method, input)
+        result = target(input)
+        logger.debug("interceptor %s result=%r", method, result)
+        return result
+
+    return logged_call
+
+
+def _install_logged_calls(
+    interceptor: Any, methods: tuple[str, ...], logger: logging.Logger
+) -> None:
+    """
+    Install logging wrappers for `methods` on an interceptor when INFO is enabled.
+
+    Otherwise nothing is installed, so the base class methods delegate straight to the
+    next interceptor without an extra frame.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    for method in methods:
+        target = getattr(interceptor.next, method)
+        setattr(interceptor, method, _make_logged_call(logger, method, target))
+
+
 class CustomWorkflowOutboundInterceptor(temporalio.worker.WorkflowOutboundInterceptor):
     """
     A custom Workflow outbound interceptor.
@@ -73,61 +120,23 @@ class CustomWorkflowOutboundInterceptor(temporalio.worker.WorkflowOutboundInterc
     Reference: https://python.temporal.io/temporalio.worker.WorkflowOutboundInterceptor.html
     """
 
+    # Calls logged when INFO is enabled
+    _LOGGED_METHODS = (
+        "continue_as_new",
+        "signal_child_workflow",
+        "signal_external_workflow",
+        "start_activity",
+        "start_child_workflow",
+        "start_local_activity",
+    )
+
     def __init__(
         self,
         next: temporalio.worker.WorkflowOutboundInterceptor,
     ) -> None:
         super().__init__(next)
         self.logger = logging.getLogger(__name__)
-
-    def continue_as_new(self, input: temporalio.worker.ContinueAsNewInput) -> None:
-        self.logger.info(">>>>> Start continue as new interceptor >>>>>")
-        self.logger.info("Continue as new input: %s", input)
-        super().continue_as_new(input)
-        self.logger.info("<<<<< End continue as new interceptor <<<<<")
-
-    async def signal_child_workflow(
-        self, input: temporalio.worker.SignalChildWorkflowInput
-    ) -> None:
-        self.logger.info(">>>>> Start signal child workflow interceptor >>>>>")
-        self.logger.info("Signal child workflow input: %s", input)
-        await super().signal_child_workflow(input)
-        self.logger.info("<<<<< End signal child workflow interceptor <<<<<")
-
-    async def signal_external_workflow(
-        self, input: temporalio.worker.SignalExternalWorkflowInput
-    ) -> None:
-        self.logger.info(">>>>> Start signal external workflow interceptor >>>>>")
-        self.logger.info("Signal external workflow input: %s", input)
-        await super().signal_external_workflow(input)
-        self.logger.info("<<<<< End signal external workflow interceptor <<<<<")
-
-    def start_activity(
-        self, input: temporalio.worker.StartActivityInput
-    ) -> temporalio.workflow.ActivityHandle:
-        self.logger.info(">>>>> Start start activity interceptor >>>>>")
-        self.logger.info("Start activity input: %s", input)
-        result = super().start_activity(input)
-        self.logger.info("<<<<< End start activity interceptor <<<<<")
-        return result
-
-    async def start_child_workflow(
-        self, input: temporalio.worker.StartChildWorkflowInput
-    ) -> temporalio.workflow.ChildWorkflowHandle:
-        self.logger.info(">>>>> Start start child workflow interceptor >>>>>")
-        self.logger.info("Start child workflow input: %s", input)
-        result = await super().start_child_workflow(input)
-        self.logger.info("<<<<< End start child workflow interceptor <<<<<")
-        return result
-
-    def start_local_activity(
-        self, input: temporalio.worker.StartLocalActivityInput
-    ) -> temporalio.workflow.ActivityHandle:
-        self.logger.info(">>>>> Start start local activity interceptor >>>>>")
-        self.logger.info("Start local activity input: %s", input)
-        result = super().start_local_activity(input)
-        self.logger.info("<<<<< End start local activity interceptor <<<<<")
-        return result
+        _install_logged_calls(self, self._LOGGED_METHODS, self.logger)
 
 
 class CustomWorkflowInboundInterceptor(temporalio.worker.WorkflowInboundInterceptor):
@@ -137,9 +146,19 @@ class CustomWorkflowInboundInterceptor(temporalio.worker.WorkflowInboundIntercep
     Reference: https://python.temporal.io/temporalio.worker.WorkflowInboundInterceptor.html
     """
 
+    # Calls logged when INFO is enabled
+    _LOGGED_METHODS = (
+        "execute_workflow",
+        "handle_signal",
+        "handle_query",
+        "handle_update_validator",
+        "handle_update_handler",
+    )
+
     def __init__(self, next: temporalio.worker.WorkflowInboundInterceptor) -> None:
         self.logger = logging.getLogger(__name__)
         super().__init__(next)
+        _install_logged_calls(self, self._LOGGED_METHODS, self.logger)
 
     def init(self, outbound: temporalio.worker.WorkflowOutboundInterceptor) -> None:
         """Implementation of
@@ -147,50 +166,6 @@ class CustomWorkflowInboundInterceptor(temporalio.worker.WorkflowInboundIntercep
         """
         super().init(CustomWorkflowOutboundInterceptor(outbound))
 
-    async def execute_workflow(
-        self, input: temporalio.worker.ExecuteWorkflowInput
-    ) -> Any:
-        """Implementation of `temporalio.worker.WorkflowInboundInterceptor.execute_workflow`."""
-        self.logger.info(">>>>> Start execute Workflow interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        result = await super().execute_workflow(input)
-        self.logger.info("<<<<< End execute Workflow interceptor <<<<<")
-        return result
-
-    async def handle_signal(self, input: temporalio.worker.HandleSignalInput) -> None:
-        """Implementation of `temporalio.worker.WorkflowInboundInterceptor.handle_signal`."""
-        self.logger.info(">>>>> Start handle Signal interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        await super().handle_signal(input)
-        self.logger.info("<<<<< End handle Signal interceptor <<<<<")
-
-    async def handle_query(self, input: temporalio.worker.HandleQueryInput) -> Any:
-        """Implementation of `temporalio.worker.WorkflowInboundInterceptor.handle_query`."""
-        self.logger.info(">>>>> Start handle Query interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        result = await super().handle_query(input)
-        self.logger.info("<<<<< End handle Query interceptor <<<<<")
-        return result
-
-    def handle_update_validator(
-        self, input: temporalio.worker.HandleUpdateInput
-    ) -> None:
-        """Implementation of `temporalio.worker.WorkflowInboundInterceptor.handle_update_validator`."""
-        self.logger.info(">>>>> Start handle Update Validator interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        super().handle_update_validator(input)
-        self.logger.info("<<<<< End handle Update Validator interceptor <<<<<")
-
-    async def handle_update_handler(
-        self, input: temporalio.worker.HandleUpdateInput
-    ) -> Any:
-        """Implementation of `temporalio.worker.WorkflowInboundInterceptor.handle_update_handler`."""
-        self.logger.info(">>>>> Start handle Update Handler interceptor >>>>>")
-        self.logger.info("Input: %s", input)
-        result = await super().handle_update_handler(input)
-        self.logger.info("<<<<< End handle Update Handler interceptor <<<<<")
-        return result
-
 
 class BasicCustomWorkerInterceptor(temporalio.worker.Interceptor):
     """
@@ -211,7 +186,10 @@ class BasicCustomWorkerInterceptor(temporalio.worker.Interceptor):
 
     def workflow_interceptor_class(
         self, input: temporalio.worker.WorkflowInterceptorClassInput
-    ) -> Type[temporalio.worker.WorkflowInboundInterceptor]:
+    ) -> Type[temporalio.worker.WorkflowInboundInterceptor] | None:
         """Implementation of `temporalio.worker.Interceptor.workflow_interceptor_class`."""
-        print("Workflow interceptor class input: %s", input)
+        del input  # unused
+        # The workflow interceptors only log, so skip them entirely when INFO is off
+        if not logging.getLogger(__name__).isEnabledFor(logging.INFO):
+            return None
         return CustomWorkflowInboundInterceptor
@@ -19,28 +19,30 @@ To run this Workflow:
 import asyncio
 import logging
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
+import uvloop
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.common import RetryPolicy
-from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import Worker
 
+from common.python.runtime import get_observable_runtime
+
 TASK_QUEUE = "failed-parallel-task-queue"
 
 
 @activity.defn
-def success() -> None:
+async def success_batch(n: int) -> None:
     """
-    A basic activity that succeeds.
+    A basic activity that succeeds `n` times in a single execution.
     """
-    activity.logger.info("Success from Activity!")
+    for _ in range(n):
+        activity.logger.info("Success from Activity!")
 
 
 @activity.defn
-def fail() -> None:
+async def fail() -> None:
     """
     A basic activity that fails.
     """
@@ -58,34 +60,30 @@ class HelloWorkflow:
         """
         Workflow runner.
         """
-        # Create a list of tasks: 10 success activities and 1 fail activity
-        tasks = []
-
-        # Add 10 success activities
-        for i in range(10):
-            task = workflow.start_local_activity(
-                success,
-                start_to_close_timeout=timedelta(seconds=1),
-            )
-            tasks.append(task)
-
-        # Add 1 fail activity
-        fail_task = workflow.start_local_activity(
-            fail,
-            start_to_close_timeout=timedelta(seconds=1),
-            retry_policy=RetryPolicy(
-                initial_interval=timedelta(seconds=2),
-                backoff_coefficient=2,
-                maximum_interval=timedelta(seconds=20),
-            ),
-        )
-        tasks.append(fail_task)
-
-        # Wait for all activities to complete
+        # The 10 successes run as one batched local activity, so they add a single
+        # marker to the history; the fail activity keeps its own retry policy
         try:
-            await asyncio.gather(*tasks, return_exceptions=True)
-        except Exception as e:
-            workflow.logger.info(f"Some activities failed: {e}")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    workflow.execute_local_activity(
+                        success_batch,
+                        10,
+                        start_to_close_timeout=timedelta(seconds=1),
+                    )
+                )
+                tg.create_task(
+                    workflow.execute_local_activity(
+                        fail,
+                        start_to_close_timeout=timedelta(seconds=1),
+                        retry_policy=RetryPolicy(
+                            initial_interval=timedelta(seconds=2),
+                            backoff_coefficient=2,
+                            maximum_interval=timedelta(seconds=20),
+                        ),
+                    )
+                )
+        except* Exception as e:
+            workflow.logger.info(f"Some activities failed: {e.exceptions}")
 
         workflow.logger.info("All activities completed")
 
@@ -94,23 +92,21 @@ async def main():
     """
     Main entry point.
     """
+    # Start tasks eagerly so those that complete without suspending skip the loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logging.basicConfig(level=logging.INFO)
 
     client = await Client.connect(
         "localhost:7233",
-        runtime=Runtime(
-            telemetry=TelemetryConfig(
-                metrics=PrometheusConfig(bind_address="0.0.0.0:9000")
-            )
-        ),
+        runtime=get_observable_runtime(),
     )
 
     async with Worker(
         client,
         task_queue=TASK_QUEUE,
         workflows=[HelloWorkflow],
-        activities=[success, fail],
-        activity_executor=ThreadPoolExecutor(5),
+        activities=[success_batch, fail],
     ):
         await client.execute_workflow(
             HelloWorkflow.run,
@@ -120,4 +116,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    uvloop.run(main())
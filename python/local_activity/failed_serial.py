@@ -25,9 +25,10 @@ from datetime import timedelta
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.common import RetryPolicy
-from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import Worker
 
+from common.python.runtime import get_observable_runtime
+
 TASK_QUEUE = "failed-serial-task-queue"
 
 
@@ -88,11 +89,7 @@ async def main():
 
     client = await Client.connect(
         "localhost:7233",
-        runtime=Runtime(
-            telemetry=TelemetryConfig(
-                metrics=PrometheusConfig(bind_address="0.0.0.0:9000")
-            )
-        ),
+        runtime=get_observable_runtime(),
     )
 
     async with Worker(
@@ -24,7 +24,7 @@ To run this Workflow:
 4. Navigate to http://localhost:9000/metrics to see the metrics.
 
 5. Confirm that the custom metrics (`custom_batch_hello_success` and `custom_batch_hello_failure`) are being reported.
-    * Try running this workflow multiple times to generate more cardinality for the metrics.
+    * Try running this workflow multiple times to see the counters increase.
 """
 
 import asyncio
@@ -53,24 +53,28 @@ class BatchHelloWorkflow:
         """
         Workflow runner.
         """
-        tasks = []
         batch_id = workflow.info().workflow_id
         workflow.logger.info("Starting batch hello. batch_id=%s.", batch_id)
-        for i in range(iterations):
-            task = workflow.start_child_workflow(
-                HelloWorkflow.run,
-                HelloWorkflowInput(batch_id=batch_id, hello_id=f"{i}"),
-                id=f"{batch_id}-hello-{i}",
-                task_queue=TASK_QUEUE,
-                parent_close_policy=ParentClosePolicy.ABANDON,
-            )
-            tasks.append(task)
-        results = await asyncio.gather(*tasks)
+        id_prefix = f"{batch_id}-hello-"
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    workflow.start_child_workflow(
+                        HelloWorkflow.run,
+                        HelloWorkflowInput(batch_id=batch_id, hello_id=hello_id),
+                        id=id_prefix + hello_id,
+                        task_queue=TASK_QUEUE,
+                        parent_close_policy=ParentClosePolicy.ABANDON,
+                    )
+                )
+                for hello_id in map(str, range(iterations))
+            ]
+        results = [task.result() for task in tasks]
         workflow.logger.info("All workflows completed. iter=%s", iterations)
         workflow.logger.info("Results: %s", results)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SayHelloActivityInput:
     """
     Input for the HelloWorkflow.
@@ -95,7 +99,7 @@ def say_hello(arg: SayHelloActivityInput) -> None:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HelloWorkflowInput:
     """
     Input for the HelloWorkflow.
@@ -139,18 +143,17 @@ class HelloWorkflow:
                 ),
             )
         except ActivityError as e:
-            # Increment the failure counter
-            self._failure_counter.add(
-                1,
-                additional_attributes={"batch_id": arg.batch_id},
+            # Increment the failure counter. The batch ID is left out of the metric
+            # attributes since every batch would create a new time series; it is
+            # logged instead.
+            workflow.logger.info(
+                "Hello failed. batch_id=%s, hello_id=%s", arg.batch_id, arg.hello_id
             )
+            self._failure_counter.add(1)
             raise e
 
         # Increment the success counter
-        self._success_counter.add(
-            1,
-            additional_attributes={"batch_id": arg.batch_id},
-        )
+        self._success_counter.add(1)
 
 
 async def main():
@@ -4,12 +4,12 @@ Temporal Worker for the Observability Workflow.
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
 from temporalio.client import Client
-from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import Worker
 
+from common.python.executor import create_activity_executor
+from common.python.runtime import get_observable_runtime
 from python.observability.custom_metrics import (
     TASK_QUEUE,
     BatchHelloWorkflow,
@@ -19,11 +19,9 @@ from python.observability.custom_metrics import (
 
 logging.basicConfig(level=logging.INFO)
 
-# Create a new runtime that has telemetry enabled. Create this first to avoid
-# the default Runtime from being lazily created.
-observable_runtime = Runtime(
-    telemetry=TelemetryConfig(metrics=PrometheusConfig(bind_address="0.0.0.0:9000"))
-)
+# Create the runtime that has telemetry enabled first to avoid the default Runtime
+# from being lazily created.
+observable_runtime = get_observable_runtime()
 
 
 async def main():
@@ -42,7 +40,7 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[BatchHelloWorkflow, HelloWorkflow],
         activities=[say_hello],
-        activity_executor=ThreadPoolExecutor(max_workers=10),
+        activity_executor=create_activity_executor(),
     )
     await worker.run()
 
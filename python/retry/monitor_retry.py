@@ -21,18 +21,56 @@ To run this Workflow:
 import asyncio
 import logging
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 from temporalio import activity, workflow
 from temporalio.client import Client
-from temporalio.common import RetryPolicy
+from temporalio.common import MetricCounter, RetryPolicy
 from temporalio.exceptions import ApplicationError
-from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import Worker
 
+from common.python.executor import create_activity_executor
+from common.python.runtime import get_observable_runtime
+
 TASK_QUEUE = "monitor-retry-task-queue"
 
+# Created on first use since the activity metric meter is only available inside an
+# activity. Its attributes (namespace, task queue and activity type) are the same for
+# every `say_hello` attempt on this worker, so one counter serves all of them.
+_HIGH_RETRY_COUNTER: MetricCounter | None = None
+
+
+def _get_high_retry_counter() -> MetricCounter:
+    """
+    Return the high retry counter, creating it on first use.
+    """
+    global _HIGH_RETRY_COUNTER
+    if _HIGH_RETRY_COUNTER is None:
+        _HIGH_RETRY_COUNTER = activity.metric_meter().create_counter(
+            name="custom_high_retry_counter",
+            description="A counter for the number of high retry attempts.",
+            unit="count",
+        )
+    return _HIGH_RETRY_COUNTER
+
+
+# Never pass the raw attempt number as a metric attribute: with up to 100 attempts
+# it would create a new time series per attempt. Use these fixed buckets instead.
+_ATTEMPT_BUCKET_LOW = {"attempt_bucket": "11-20"}
+_ATTEMPT_BUCKET_MID = {"attempt_bucket": "21-50"}
+_ATTEMPT_BUCKET_HIGH = {"attempt_bucket": "51+"}
+
+
+def _attempt_bucket(attempt: int) -> dict[str, str]:
+    """
+    Return the bounded metric attributes for a high retry attempt.
+    """
+    if attempt <= 20:
+        return _ATTEMPT_BUCKET_LOW
+    if attempt <= 50:
+        return _ATTEMPT_BUCKET_MID
+    return _ATTEMPT_BUCKET_HIGH
+
 
 @activity.defn
 def say_hello() -> None:
@@ -46,15 +84,9 @@ def say_hello() -> None:
         # Always raise an error to test the retry logic.
         raise RuntimeError("Failed to say hello.")
     except RuntimeError as e:
-        activity_meter = activity.metric_meter()
-        high_retry_counter = activity_meter.create_counter(
-            name="custom_high_retry_counter",
-            description="A counter for the number of high retry attempts.",
-            unit="count",
-        )
         if attempt > 10:
             activity.logger.info("High retry attempt %s", attempt)
-            high_retry_counter.add(1)
+            _get_high_retry_counter().add(1, _attempt_bucket(attempt))
         if attempt > 20:
             activity.logger.info("Delay next retry. %s", attempt)
             raise ApplicationError(
@@ -95,11 +127,7 @@ async def main():
 
     client = await Client.connect(
         "localhost:7233",
-        runtime=Runtime(
-            telemetry=TelemetryConfig(
-                metrics=PrometheusConfig(bind_address="0.0.0.0:9000")
-            )
-        ),
+        runtime=get_observable_runtime(),
     )
 
     async with Worker(
@@ -107,7 +135,7 @@ async def main():
         task_queue=TASK_QUEUE,
         workflows=[HelloWorkflow],
         activities=[say_hello],
-        activity_executor=ThreadPoolExecutor(5),
+        activity_executor=create_activity_executor(),
     ):
         await client.execute_workflow(
             HelloWorkflow.run,
@@ -6,7 +6,9 @@ import logging
 import logging.config
 import os
 from enum import StrEnum
+from typing import Any
 
+import orjson
 import structlog
 
 
@@ -27,6 +29,24 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
+# Event dict keys and the `logging.LogRecord` attributes they are extracted from
+_RECORD_FIELDS = (
+    ("level", "levelname"),
+    ("filename", "filename"),
+    ("funcName", "funcName"),
+    ("lineno", "lineno"),
+    ("thread_name", "threadName"),
+    ("process_name", "processName"),
+)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize with orjson, decoding to `str` as `logging` formatters must return text.
+    """
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 class Logger:
     """Complete production setup for replacing logging with structlog"""
 
@@ -35,10 +55,12 @@ class Logger:
         app_name: str,
         stage: Stage = Stage.DEVELOPMENT,
         log_level: LogLevel = LogLevel.INFO,
+        render_stack_info: bool = False,
     ):
         self.app_name = app_name
         self.stage = stage
         self.log_level = log_level
+        self.render_stack_info = render_stack_info
         self.is_development = stage == Stage.DEVELOPMENT
 
     def setup(self):
@@ -59,18 +81,19 @@ class Logger:
             timestamper,
         ]
 
+        app_name = self.app_name
+
         def _extract_from_record(_, __, event_dict):
             """
             Extract fields from logging record, and add them to the event dict.
             """
-            record: logging.LogRecord = event_dict["_record"]
-            event_dict["level"] = record.levelname
-            event_dict["filename"] = record.filename
-            event_dict["funcName"] = record.funcName
-            event_dict["lineno"] = record.lineno
-            event_dict["thread_name"] = record.threadName
-            event_dict["process_name"] = record.processName
-            event_dict["app_name"] = self.app_name
+            record: logging.LogRecord | None = event_dict.get("_record")
+            if record is None:
+                return event_dict
+            event_dict.update(
+                {key: getattr(record, attr) for key, attr in _RECORD_FIELDS}
+            )
+            event_dict["app_name"] = app_name
             # Handle exception info
             if record.exc_info:
                 event_dict["exc_info"] = record.exc_info
@@ -82,12 +105,14 @@ class Logger:
         ]
 
         if self.is_development:
+            # `ConsoleRenderer` renders exceptions itself
             logging_processors.append(structlog.dev.ConsoleRenderer(colors=True))
         else:
             logging_processors.extend(
                 [
+                    structlog.processors.format_exc_info,
                     structlog.processors.UnicodeDecoder(),
-                    structlog.processors.JSONRenderer(),
+                    structlog.processors.JSONRenderer(serializer=_orjson_dumps),
                 ]
             )
 
@@ -119,15 +144,19 @@ class Logger:
             }
         )
 
+        # Exceptions are formatted by the renderers above, only for records that
+        # carry one, so the per-call chain stays free of exception and stack handling
+        processors = [
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            timestamper,
+        ]
+        if self.render_stack_info:
+            processors.append(structlog.processors.StackInfoRenderer())
+        processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
+
         structlog.configure(
-            processors=[
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                timestamper,
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-            ],
+            processors=processors,
             logger_factory=structlog.stdlib.LoggerFactory(),
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
@@ -155,13 +184,9 @@ def demo():
     std_logger = logging.getLogger("myapp.module")
     std_logger.info("Standard logging message")
 
-    # Third-party libraries
-    import requests
-
-    try:
-        response = requests.get("https://httpbin.org/status/500")
-    except Exception:
-        pass  # All requests logs go through structlog
+    # Third-party libraries log through the standard library too, so their logs go
+    # through structlog as well
+    logging.getLogger("urllib3.connectionpool").warning("Retrying request")
 
     # Bind context for this session
     session_logger = log.bind(session_id="sess-123")
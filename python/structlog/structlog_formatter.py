@@ -4,13 +4,14 @@ Basic example of using structlog with Temporal.
 
 import asyncio
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from common.python.executor import create_activity_executor
+
 with workflow.unsafe.imports_passed_through():
     from python.structlog.log import log
 
@@ -52,7 +53,7 @@ async def main():
         task_queue="hello-activity-task-queue",
         workflows=[HelloWorldWorkflow],
         activities=[say_hello],
-        activity_executor=ThreadPoolExecutor(5),
+        activity_executor=create_activity_executor(),
     ):
 
         result = await client.execute_workflow(
@@ -60,7 +61,7 @@ async def main():
             id=f"structlog-hello-{uuid.uuid4()}",
             task_queue="hello-activity-task-queue",
         )
-        log.info(f"Result: {result}")
+        log.info("Workflow completed.", result=result)
 
 
 if __name__ == "__main__":
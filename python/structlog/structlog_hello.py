@@ -5,35 +5,45 @@ Basic example of using structlog with Temporal.
 import asyncio
 import logging
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 from temporalio import activity, workflow
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from common.python.executor import create_activity_executor
+
 with workflow.unsafe.imports_passed_through():
     import structlog
 
 
-structlog.configure(
-    processors=[
-        # Prepare event dict for `ProcessorFormatter`.
-        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-    ],
-    logger_factory=structlog.stdlib.LoggerFactory(),
-)
-
-formatter = structlog.stdlib.ProcessorFormatter(
-    processors=[structlog.dev.ConsoleRenderer()],
-)
+def configure_logging() -> None:
+    """
+    Route standard library logging through structlog.
 
-handler = logging.StreamHandler()
-# Use OUR `ProcessorFormatter` to format all `logging` entries.
-handler.setFormatter(formatter)
-root_logger = logging.getLogger()
-root_logger.addHandler(handler)
-root_logger.setLevel(logging.INFO)
+    Called from `main` rather than at import, because the workflow sandbox re-imports
+    this module for every workflow run and would otherwise add another handler each
+    time.
+    """
+    structlog.configure(
+        processors=[
+            # Prepare event dict for `ProcessorFormatter`.
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[structlog.dev.ConsoleRenderer()],
+    )
+
+    handler = logging.StreamHandler()
+    # Use OUR `ProcessorFormatter` to format all `logging` entries.
+    handler.setFormatter(formatter)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.INFO)
 
 
 @activity.defn
@@ -64,6 +74,8 @@ class HelloWorldWorkflow:
 
 
 async def main():
+    configure_logging()
+
     client = await Client.connect("localhost:7233")
     logger = structlog.get_logger()
     logger.info("Temporal client connected.")
@@ -73,7 +85,7 @@ async def main():
         task_queue="hello-activity-task-queue",
         workflows=[HelloWorldWorkflow],
         activities=[say_hello],
-        activity_executor=ThreadPoolExecutor(5),
+        activity_executor=create_activity_executor(),
     ):
 
         result = await client.execute_workflow(
@@ -81,7 +93,7 @@ async def main():
             id=f"structlog-hello-{uuid.uuid4()}",
             task_queue="hello-activity-task-queue",
         )
-        logger.info(f"Result: {result}")
+        logger.info("Workflow completed.", result=result)
 
 
 if __name__ == "__main__":
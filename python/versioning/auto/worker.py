@@ -1,6 +1,5 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
 from temporalio.client import Client
 from temporalio.worker import Worker, WorkerDeploymentConfig, WorkerDeploymentVersion
@@ -22,7 +21,6 @@ async def main():
         task_queue="versioning-basic-task-queue",
         workflows=[MoneyTransferWorkflow],
         activities=[deposit, validate_transfer, withdraw],
-        activity_executor=ThreadPoolExecutor(2),
         deployment_config=WorkerDeploymentConfig(
             version=WorkerDeploymentVersion(
                 deployment_name="money_transfer",
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
 from temporalio.client import Client
 from temporalio.worker import Worker, WorkerDeploymentConfig, WorkerDeploymentVersion
@@ -27,7 +26,6 @@ async def main():
         task_queue="versioning-basic-task-queue",
         workflows=[MoneyTransferWorkflowV2],
         activities=[deposit, validate_transfer, withdraw, notify_user],
-        activity_executor=ThreadPoolExecutor(2),
         deployment_config=WorkerDeploymentConfig(
             version=WorkerDeploymentVersion(
                 deployment_name="money_transfer",
@@ -66,6 +66,9 @@ from temporalio.common import RetryPolicy, SearchAttributeKey, VersioningBehavio
 with workflow.unsafe.imports_passed_through():
     from python.versioning.auto.activities import deposit, validate_transfer, withdraw
 
+_ACTIVITY_TIMEOUT = timedelta(seconds=10)
+_ACTIVITY_RETRY_POLICY = RetryPolicy(maximum_interval=timedelta(seconds=1))
+
 
 @workflow.defn(
     name="MoneyTransferWorkflow", versioning_behavior=VersioningBehavior.AUTO_UPGRADE
@@ -76,6 +79,10 @@ class MoneyTransferWorkflow:
     """
 
     WORKFLOW_STEP = SearchAttributeKey.for_keyword("Step")
+    # Search attribute updates for each step, built once rather than per upsert
+    _STEP_VALIDATING = WORKFLOW_STEP.value_set("VALIDATING")
+    _STEP_WITHDRAWING = WORKFLOW_STEP.value_set("WITHDRAWING")
+    _STEP_DEPOSITING = WORKFLOW_STEP.value_set("DEPOSITING")
 
     @workflow.run
     async def run(self) -> None:
@@ -85,34 +92,28 @@ class MoneyTransferWorkflow:
         workflow_id = workflow.info().workflow_id
         workflow.logger.info(f"Workflow ID: {workflow_id}")
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("VALIDATING")])
+        workflow.upsert_search_attributes([self._STEP_VALIDATING])
         await workflow.execute_activity(
             validate_transfer,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("WITHDRAWING")])
+        workflow.upsert_search_attributes([self._STEP_WITHDRAWING])
         await workflow.execute_activity(
             withdraw,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("DEPOSITING")])
+        workflow.upsert_search_attributes([self._STEP_DEPOSITING])
         await workflow.execute_activity(
             deposit,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
 
 
@@ -1,7 +1,7 @@
-import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
+import uvloop
 from temporalio.client import Client
 from temporalio.worker import Worker, WorkerDeploymentConfig, WorkerDeploymentVersion
 
@@ -36,4 +36,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    uvloop.run(main())
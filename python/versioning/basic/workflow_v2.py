@@ -13,6 +13,7 @@ from datetime import timedelta
 from temporalio import workflow
 from temporalio.client import Client
 from temporalio.common import RetryPolicy, SearchAttributeKey, VersioningBehavior
+from temporalio.exceptions import ActivityError
 
 with workflow.unsafe.imports_passed_through():
     from python.versioning.basic.activities import (
@@ -22,6 +23,15 @@ with workflow.unsafe.imports_passed_through():
         withdraw,
     )
 
+_ACTIVITY_TIMEOUT = timedelta(seconds=10)
+_ACTIVITY_RETRY_POLICY = RetryPolicy(maximum_interval=timedelta(seconds=1))
+# The notification is best-effort, so it gives up rather than retrying forever
+_NOTIFY_RETRY_POLICY = RetryPolicy(
+    maximum_interval=timedelta(seconds=1), maximum_attempts=5
+)
+# Retries of local activities backing off longer than this are scheduled with a timer
+_LOCAL_RETRY_THRESHOLD = timedelta(seconds=2)
+
 
 @workflow.defn(
     name="MoneyTransferWorkflow", versioning_behavior=VersioningBehavior.PINNED
@@ -32,6 +42,12 @@ class MoneyTransferWorkflowV2:
     """
 
     WORKFLOW_STEP = SearchAttributeKey.for_keyword("Step")
+    # Search attribute updates for each step, built once rather than per upsert
+    _STEP_WITHDRAWING = WORKFLOW_STEP.value_set("WITHDRAWING")
+    _STEP_DEPOSITING = WORKFLOW_STEP.value_set("DEPOSITING")
+
+    def __init__(self) -> None:
+        self._step = "VALIDATING"
 
     @workflow.run
     async def run(self) -> None:
@@ -40,43 +56,59 @@ class MoneyTransferWorkflowV2:
         """
         workflow_id = workflow.info().workflow_id
 
-        # Introduce a new activity `notify_user` in Workflow V2
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("NOTIFYING")])
-        await workflow.execute_activity(
+        # Introduce a new activity `notify_user` in Workflow V2. The transfer does not
+        # depend on it, so it is started as a regular activity that runs alongside the
+        # transfer steps. The short validation step runs as a local activity on this
+        # worker, skipping the task queue round trip. A local activity holds the
+        # workflow task open, which is harmless here since withdraw waits for it.
+        # The validation finishes before the first workflow task completes, so a step
+        # upserted for it would be overwritten before it is visible. The `get_step`
+        # query reports the current step instead.
+        notify_handle = workflow.start_activity(
             notify_user,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_NOTIFY_RETRY_POLICY,
         )
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("VALIDATING")])
-        await workflow.execute_activity(
+        await workflow.execute_local_activity(
             validate_transfer,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
+            local_retry_threshold=_LOCAL_RETRY_THRESHOLD,
         )
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("WITHDRAWING")])
+        self._step = "WITHDRAWING"
+        workflow.upsert_search_attributes([self._STEP_WITHDRAWING])
         await workflow.execute_activity(
             withdraw,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
 
-        workflow.upsert_search_attributes([self.WORKFLOW_STEP.value_set("DEPOSITING")])
+        self._step = "DEPOSITING"
+        workflow.upsert_search_attributes([self._STEP_DEPOSITING])
         await workflow.execute_activity(
             deposit,
             workflow_id,
-            start_to_close_timeout=timedelta(seconds=10),
-            retry_policy=RetryPolicy(
-                maximum_interval=timedelta(seconds=1),
-            ),
+            start_to_close_timeout=_ACTIVITY_TIMEOUT,
+            retry_policy=_ACTIVITY_RETRY_POLICY,
         )
+
+        # Wait for the notification before completing, but do not fail a finished
+        # transfer because the user could not be notified
+        try:
+            await notify_handle
+        except ActivityError:
+            workflow.logger.warning(
+                "Failed to notify user. workflow_id=%s", workflow_id
+            )
+
+    @workflow.query
+    def get_step(self) -> str:
+        """
+        Query to get the current transfer step.
+        """
+        return self._step